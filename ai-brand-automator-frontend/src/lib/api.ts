@@ -249,9 +249,23 @@ export const subscriptionApi = {
     const response = await apiClient.post('/subscriptions/sync/', {});
     if (!response.ok) {
       const error = await response.json();
-      throw new Error(error.error || 'Failed to sync subscription');
+      throw new Error(error.detail || error.error || 'Failed to sync subscription');
     }
-    return response.json();
+    // The sync runs in a background task; poll until it finishes
+    const { task_id } = await response.json();
+    for (let attempt = 0; attempt < 20; attempt++) {
+      await new Promise(resolve => setTimeout(resolve, 500));
+      const result = await apiClient.get(`/subscriptions/sync/${task_id}/`);
+      if (result.status === 202) {
+        continue;
+      }
+      const data = await result.json();
+      if (!result.ok) {
+        throw new Error(data.detail || 'Failed to sync subscription');
+      }
+      return data;
+    }
+    throw new Error('Subscription sync timed out');
   },
 
   async getPaymentHistory(): Promise<PaymentHistory[]> {
@@ -6,10 +6,23 @@ import logging
 import re
 from django.http import JsonResponse
 from django.conf import settings
+from django_tenants.middleware.main import TenantMainMiddleware
+
+from tenants.cache import get_tenant_for_domain
 
 logger = logging.getLogger(__name__)
 
 
+class CachedTenantMiddleware(TenantMainMiddleware):
+    """
+    django-tenants middleware that caches the hostname -> tenant lookup,
+    sparing a Domain/Tenant query on every request.
+    """
+
+    def get_tenant(self, domain_model, hostname):
+        return get_tenant_for_domain(hostname)
+
+
 class SecurityMiddleware:
     """
     Middleware for additional security measures:
@@ -81,6 +81,7 @@ SHARED_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "django.contrib.admin",
+    "django.contrib.postgres",  # expression indexes with opclasses
     # Third party apps
     "rest_framework",
     "rest_framework_simplejwt",
@@ -111,7 +112,7 @@ MIDDLEWARE = [
     # CORS middleware - MUST BE FIRST for preflight OPTIONS requests
     "corsheaders.middleware.CorsMiddleware",
     # Multi-tenancy middleware
-    "django_tenants.middleware.main.TenantMainMiddleware",
+    "brand_automator.middleware.CachedTenantMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -160,6 +161,10 @@ DATABASES = {
         "PASSWORD": config("DB_PASSWORD", default=""),
         "HOST": config("DB_HOST", default="localhost"),
         "PORT": config("DB_PORT", default="5432"),
+        # Reuse connections across requests; django-tenants still sets the
+        # search_path per request. Use 0 behind a transaction-mode pooler.
+        "CONN_MAX_AGE": config("DB_CONN_MAX_AGE", default=60, cast=int),
+        "CONN_HEALTH_CHECKS": True,
         "OPTIONS": {
             "sslmode": config("DB_SSLMODE", default="require"),
             "channel_binding": config("DB_CHANNEL_BINDING", default="require"),
@@ -167,6 +172,32 @@ DATABASES = {
     }
 }
 
+# Cache
+# Redis when REDIS_URL is configured; otherwise (and under pytest) fall back
+# to a per-process in-memory cache. IGNORE_EXCEPTIONS turns Redis errors into
+# cache misses, so an outage falls back to database reads instead of a 500.
+REDIS_URL = config("REDIS_URL", default="")
+if REDIS_URL and not TESTING:
+    CACHES = {
+        "default": {
+            "BACKEND": "django_redis.cache.RedisCache",
+            "LOCATION": REDIS_URL,
+            "OPTIONS": {
+                "CLIENT_CLASS": "django_redis.client.DefaultClient",
+                "IGNORE_EXCEPTIONS": True,
+                "SOCKET_CONNECT_TIMEOUT": 1,  # seconds
+                "SOCKET_TIMEOUT": 1,  # seconds
+            },
+        }
+    }
+    DJANGO_REDIS_LOG_IGNORED_EXCEPTIONS = True
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
 # Multi-tenancy settings
 DATABASE_ROUTERS = ("django_tenants.routers.TenantSyncRouter",)
 TENANT_MODEL = "tenants.Tenant"
@@ -471,4 +502,8 @@ CELERY_BEAT_SCHEDULE = {
         # of timely delivery. For lower frequency, change to 300.0 (5 min).
         "schedule": 60.0,
     },
+    "prune-webhook-events": {
+        "task": "subscriptions.prune_webhook_events",
+        "schedule": 86400.0,  # daily
+    },
 }
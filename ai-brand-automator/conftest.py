@@ -71,6 +71,20 @@ def reset_to_public_schema(db):
         pass  # Ignore if not in tenant context
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty cache.
+
+    Tenant lookups and plan listings are cached, and rolled-back test data
+    must not be served from a previous test's cache entries.
+    """
+    from django.core.cache import cache
+
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def api_client():
     """DRF API test client with tenant middleware support"""
@@ -1,6 +1,19 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class SubscriptionsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "subscriptions"
+
+    def ready(self):
+        # Import signals here to ensure they are loaded
+        import subscriptions.signals  # noqa: F401
+
+        # Configure the Stripe SDK at startup instead of on the first request
+        # that builds the StripeService
+        import stripe
+
+        api_key = getattr(settings, "STRIPE_SECRET_KEY", None)
+        if api_key:
+            stripe.api_key = api_key
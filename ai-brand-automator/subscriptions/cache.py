@@ -0,0 +1,69 @@
+"""
+Cache helpers for subscription plan data.
+"""
+from django.core.cache import cache
+
+from .models import SubscriptionPlan
+
+PLANS_CACHE_KEY = "subs:plans:v3"
+ACTIVE_PLANS_CACHE_KEY = "subs:active_plans:v1"
+PLANS_CACHE_TIMEOUT = 300  # 5 minutes
+NO_SUBSCRIPTION_CACHE_TIMEOUT = 60  # 1 minute
+
+
+def get_cached_plans():
+    """Return the cached serialized list of active plans, or None."""
+    return cache.get(PLANS_CACHE_KEY)
+
+
+def set_cached_plans(data):
+    """Store the serialized list of active plans."""
+    cache.set(PLANS_CACHE_KEY, data, PLANS_CACHE_TIMEOUT)
+
+
+def get_active_plans():
+    """Return active plans as a {plan_id: SubscriptionPlan} dict."""
+    plans = cache.get(ACTIVE_PLANS_CACHE_KEY)
+    if plans is None:
+        plans = {
+            plan.id: plan for plan in SubscriptionPlan.objects.filter(is_active=True)
+        }
+        cache.set(ACTIVE_PLANS_CACHE_KEY, plans, PLANS_CACHE_TIMEOUT)
+    return plans
+
+
+def get_active_plan(plan_id):
+    """Return the active plan with the given id, or None."""
+    return get_active_plans().get(plan_id)
+
+
+def get_active_plan_by_price(price_id):
+    """Return the active plan billed with the given Stripe price, or None."""
+    for plan in get_active_plans().values():
+        if plan.stripe_price_id == price_id:
+            return plan
+    return None
+
+
+def invalidate_plan_cache():
+    """Drop cached plan data after a plan is created, changed or deleted."""
+    cache.delete_many([PLANS_CACHE_KEY, ACTIVE_PLANS_CACHE_KEY])
+
+
+def no_subscription_cache_key(tenant_id):
+    return f"subs:no_sub:{tenant_id}"
+
+
+def has_no_subscription(tenant_id):
+    """Return True if Stripe recently reported no subscription for the tenant."""
+    return cache.get(no_subscription_cache_key(tenant_id)) is not None
+
+
+def mark_no_subscription(tenant_id):
+    """Remember briefly that Stripe has no subscription for the tenant."""
+    cache.set(no_subscription_cache_key(tenant_id), 1, NO_SUBSCRIPTION_CACHE_TIMEOUT)
+
+
+def clear_no_subscription(tenant_id):
+    """Forget the no-subscription flag once the tenant subscribes."""
+    cache.delete(no_subscription_cache_key(tenant_id))
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.16 on 2026-10-17 10:00
+
+from django.db import migrations, models
+
+
+def populate_plan_display_name(apps, schema_editor):
+    Subscription = apps.get_model("subscriptions", "Subscription")
+    for subscription in Subscription.objects.select_related("plan"):
+        subscription.plan_display_name = subscription.plan.display_name
+        subscription.save(update_fields=["plan_display_name"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("subscriptions", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="subscription",
+            name="plan_display_name",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.RunPython(populate_plan_display_name, migrations.RunPython.noop),
+    ]
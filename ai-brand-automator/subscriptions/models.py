@@ -79,6 +79,9 @@ class Subscription(models.Model):
         on_delete=models.PROTECT,
         related_name="subscriptions",
     )
+    # Denormalized copy of plan.display_name so payment webhooks can build
+    # descriptions without loading the plan row.
+    plan_display_name = models.CharField(max_length=100, blank=True)
     stripe_subscription_id = models.CharField(max_length=255, unique=True)
     stripe_customer_id = models.CharField(max_length=255)
 
@@ -93,9 +96,34 @@ class Subscription(models.Model):
     class Meta:
         ordering = ["-created_at"]
 
+    # plan_id as last loaded or saved; None for unsaved or plan-deferred rows
+    _saved_plan_id = None
+
     def __str__(self):
         return f"{self.tenant.name} - {self.plan.display_name} ({self.status})"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._saved_plan_id = instance.__dict__.get("plan_id")
+        return instance
+
+    def save(self, *args, **kwargs):
+        # Refresh the denormalized plan name whenever the plan is reassigned,
+        # unless plan_id is deferred or left out of update_fields
+        update_fields = kwargs.get("update_fields")
+        plan_saved = update_fields is None or {"plan", "plan_id"} & set(update_fields)
+        if (
+            plan_saved
+            and "plan_id" in self.__dict__
+            and self.plan_id != self._saved_plan_id
+        ):
+            self.plan_display_name = self.plan.display_name
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "plan_display_name"}
+        super().save(*args, **kwargs)
+        self._saved_plan_id = self.__dict__.get("plan_id")
+
     @property
     def is_active(self):
         return self.status in ["active", "trialing"]
@@ -147,3 +175,15 @@ class PaymentHistory(models.Model):
 
     def __str__(self):
         return f"{self.tenant.name} - ${self.amount} ({self.status})"
+
+
+class ProcessedWebhookEvent(models.Model):
+    """Stripe webhook events already handled, so redeliveries are skipped"""
+
+    event_id = models.CharField(max_length=255, unique=True)
+    event_type = models.CharField(max_length=100)
+    # Indexed for the periodic cleanup of old rows
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    def __str__(self):
+        return f"{self.event_type} ({self.event_id})"
@@ -3,12 +3,25 @@ Stripe service wrapper for payment operations.
 """
 import stripe
 import logging
+import time
+from functools import lru_cache, wraps
 from django.conf import settings
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from django.utils import timezone
 from datetime import datetime
 
-from .models import Subscription, SubscriptionPlan, PaymentHistory
+from .cache import (
+    clear_no_subscription,
+    get_active_plan_by_price,
+    has_no_subscription,
+    mark_no_subscription,
+)
+from .models import (
+    PaymentHistory,
+    ProcessedWebhookEvent,
+    Subscription,
+    SubscriptionPlan,
+)
 
 # Zero-decimal currencies (amounts not in cents)
 ZERO_DECIMAL_CURRENCIES = {
@@ -38,12 +51,58 @@ def convert_stripe_amount(amount: int, currency: str) -> float:
     return amount / 100
 
 
+def signature_timestamp(sig_header: str):
+    """Return the t= timestamp from a Stripe-Signature header, or None."""
+    for item in sig_header.split(","):
+        key, _, value = item.partition("=")
+        if key.strip() == "t":
+            try:
+                return int(value)
+            except ValueError:
+                return None
+    return None
+
+
+def stripe_period_fields(stripe_sub) -> dict:
+    """Map a Stripe subscription's billing period epochs to model fields."""
+    return {
+        "current_period_start": datetime.fromtimestamp(
+            stripe_sub["current_period_start"], tz=timezone.utc
+        ),
+        "current_period_end": datetime.fromtimestamp(
+            stripe_sub["current_period_end"], tz=timezone.utc
+        ),
+    }
+
+
 logger = logging.getLogger(__name__)
 
 
+def _require_stripe(method):
+    """Return None instead of calling Stripe when no API key is configured."""
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self.api_key:
+            logger.error("Stripe not configured")
+            return None
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class StripeService:
     """Service for interacting with Stripe API"""
 
+    # Webhook event type -> handler method name, built once per process
+    WEBHOOK_HANDLERS = {
+        "checkout.session.completed": "_handle_checkout_completed",
+        "invoice.payment_succeeded": "_handle_payment_succeeded",
+        "invoice.payment_failed": "_handle_payment_failed",
+        "customer.subscription.updated": "_handle_subscription_updated",
+        "customer.subscription.deleted": "_handle_subscription_deleted",
+    }
+
     def __init__(self):
         self.api_key = getattr(settings, "STRIPE_SECRET_KEY", None)
         if self.api_key:
@@ -51,12 +110,9 @@ class StripeService:
         else:
             logger.warning("STRIPE_SECRET_KEY not configured")
 
+    @_require_stripe
     def create_customer(self, tenant, email):
         """Create a Stripe customer for a tenant"""
-        if not self.api_key:
-            logger.error("Stripe not configured")
-            return None
-
         try:
             customer = stripe.Customer.create(
                 email=email,
@@ -83,12 +139,9 @@ class StripeService:
                 pass
         return self.create_customer(tenant, email)
 
+    @_require_stripe
     def create_checkout_session(self, tenant, plan, success_url, cancel_url, email):
         """Create a Stripe Checkout session for subscription"""
-        if not self.api_key:
-            logger.error("Stripe not configured")
-            return None
-
         try:
             customer = self.get_or_create_customer(tenant, email)
 
@@ -114,12 +167,9 @@ class StripeService:
             logger.error(f"Failed to create checkout session: {e}")
             raise
 
+    @_require_stripe
     def create_portal_session(self, tenant, return_url):
         """Create a Stripe Customer Portal session"""
-        if not self.api_key:
-            logger.error("Stripe not configured")
-            return None
-
         if not tenant.stripe_customer_id:
             raise ValueError("Tenant has no Stripe customer ID")
 
@@ -133,12 +183,9 @@ class StripeService:
             logger.error(f"Failed to create portal session: {e}")
             raise
 
+    @_require_stripe
     def cancel_subscription(self, subscription, at_period_end=True):
         """Cancel a subscription"""
-        if not self.api_key:
-            logger.error("Stripe not configured")
-            return None
-
         try:
             if at_period_end:
                 stripe_sub = stripe.Subscription.modify(
@@ -161,6 +208,18 @@ class StripeService:
         """Process Stripe webhook events"""
         webhook_secret = getattr(settings, "STRIPE_WEBHOOK_SECRET", None)
 
+        # Reject replayed or malformed deliveries before hashing the payload;
+        # construct_event applies the same tolerance, but only after the HMAC.
+        timestamp = signature_timestamp(sig_header)
+        if (
+            timestamp is None
+            or timestamp < time.time() - stripe.Webhook.DEFAULT_TOLERANCE
+        ):
+            logger.error("Stale or malformed webhook signature header")
+            raise stripe.error.SignatureVerificationError(
+                "Timestamp outside the tolerance zone", sig_header
+            )
+
         try:
             event = stripe.Webhook.construct_event(payload, sig_header, webhook_secret)
         except ValueError:
@@ -170,24 +229,32 @@ class StripeService:
             logger.error("Invalid webhook signature")
             raise
 
-        return self._process_event(event)
+        # Stripe redelivers events; the unique event_id row makes sure only
+        # the first delivery is processed, whichever worker receives it. The
+        # claim commits on its own so no transaction stays open while the
+        # handlers call Stripe, and is released if processing fails so
+        # Stripe's retry is processed again.
+        _, created = ProcessedWebhookEvent.objects.get_or_create(
+            event_id=event["id"], defaults={"event_type": event["type"]}
+        )
+        if not created:
+            logger.info(f"Skipping duplicate webhook event: {event['id']}")
+            return {"status": "duplicate", "event_id": event["id"]}
+
+        try:
+            return self._process_event(event)
+        except Exception:
+            ProcessedWebhookEvent.objects.filter(event_id=event["id"]).delete()
+            raise
 
     def _process_event(self, event):
         """Process different webhook event types"""
         event_type = event["type"]
         data = event["data"]["object"]
 
-        handlers = {
-            "checkout.session.completed": self._handle_checkout_completed,
-            "invoice.payment_succeeded": self._handle_payment_succeeded,
-            "invoice.payment_failed": self._handle_payment_failed,
-            "customer.subscription.updated": self._handle_subscription_updated,
-            "customer.subscription.deleted": self._handle_subscription_deleted,
-        }
-
-        handler = handlers.get(event_type)
-        if handler:
-            return handler(data)
+        handler_name = self.WEBHOOK_HANDLERS.get(event_type)
+        if handler_name:
+            return getattr(self, handler_name)(data)
         else:
             logger.info(f"Unhandled webhook event type: {event_type}")
             return {"status": "ignored", "event_type": event_type}
@@ -204,28 +271,31 @@ class StripeService:
             return {"status": "error", "message": "Missing metadata"}
 
         try:
-            # Use transaction.atomic() to ensure all DB changes are atomic
-            with transaction.atomic():
-                tenant = Tenant.objects.get(id=tenant_id)
-                plan = SubscriptionPlan.objects.get(id=plan_id)
+            plan = SubscriptionPlan.objects.get(id=plan_id)
 
-                # Retrieve the subscription from Stripe
-                stripe_sub = stripe.Subscription.retrieve(session["subscription"])
+            # Retrieve the subscription from Stripe before opening the
+            # transaction so no DB connection or row lock is held during the
+            # network round-trip
+            stripe_sub = stripe.Subscription.retrieve(session["subscription"])
+
+            # Use transaction.atomic() to ensure all DB changes are atomic.
+            # Lock the tenant row so duplicate checkout.session.completed
+            # deliveries are applied one after another instead of racing.
+            with transaction.atomic():
+                tenant = Tenant.objects.select_for_update(of=("self",)).get(
+                    id=tenant_id
+                )
 
                 # Create or update subscription
                 subscription, created = Subscription.objects.update_or_create(
                     tenant=tenant,
                     defaults={
                         "plan": plan,
+                        "plan_display_name": plan.display_name,
                         "stripe_subscription_id": stripe_sub.id,
                         "stripe_customer_id": session["customer"],
                         "status": stripe_sub.status,
-                        "current_period_start": datetime.fromtimestamp(
-                            stripe_sub.current_period_start, tz=timezone.utc
-                        ),
-                        "current_period_end": datetime.fromtimestamp(
-                            stripe_sub.current_period_end, tz=timezone.utc
-                        ),
+                        **stripe_period_fields(stripe_sub),
                     },
                 )
 
@@ -234,6 +304,8 @@ class StripeService:
                 tenant.subscription_status = "active"
                 tenant.save(update_fields=["stripe_customer_id", "subscription_status"])
 
+            clear_no_subscription(tenant.id)
+
             return {"status": "success", "subscription_id": subscription.id}
 
         except (Tenant.DoesNotExist, SubscriptionPlan.DoesNotExist) as e:
@@ -263,7 +335,7 @@ class StripeService:
                 currency=currency,
                 status="succeeded",
                 description=(
-                    f"Subscription payment for {subscription.plan.display_name}"
+                    f"Subscription payment for {subscription.plan_display_name}"
                 ),
             )
 
@@ -316,16 +388,20 @@ class StripeService:
             )
 
             subscription.status = stripe_sub["status"]
-            subscription.current_period_start = datetime.fromtimestamp(
-                stripe_sub["current_period_start"], tz=timezone.utc
-            )
-            subscription.current_period_end = datetime.fromtimestamp(
-                stripe_sub["current_period_end"], tz=timezone.utc
-            )
+            for field, value in stripe_period_fields(stripe_sub).items():
+                setattr(subscription, field, value)
             subscription.cancel_at_period_end = stripe_sub.get(
                 "cancel_at_period_end", False
             )
-            subscription.save()
+            subscription.save(
+                update_fields=[
+                    "status",
+                    "current_period_start",
+                    "current_period_end",
+                    "cancel_at_period_end",
+                    "updated_at",
+                ]
+            )
 
             return {"status": "updated", "subscription_id": subscription.id}
 
@@ -364,6 +440,11 @@ class StripeService:
         if not tenant.stripe_customer_id:
             raise ValueError("No Stripe customer associated with this account")
 
+        # Skip the Stripe round-trip for tenants Stripe just told us have no
+        # subscription (e.g. clients retrying sync in a loop)
+        if has_no_subscription(tenant.id):
+            raise ValueError("No subscription found in Stripe")
+
         # Fetch subscriptions from Stripe for this customer
         subscriptions = stripe.Subscription.list(
             customer=tenant.stripe_customer_id,
@@ -372,38 +453,62 @@ class StripeService:
         )
 
         if not subscriptions.data:
+            mark_no_subscription(tenant.id)
             raise ValueError("No subscription found in Stripe")
 
         stripe_sub = subscriptions.data[0]
 
-        # Find the plan by matching the price ID
+        # Find the plan by matching the price ID, from the cached active plans
+        # when possible; deactivated plans still resolve from the database
         price_id = stripe_sub["items"]["data"][0]["price"]["id"]
-        try:
-            plan = SubscriptionPlan.objects.get(stripe_price_id=price_id)
-        except SubscriptionPlan.DoesNotExist:
-            raise ValueError(f"Plan not found for price: {price_id}")
-
-        # Create or update local subscription atomically
-        with transaction.atomic():
-            subscription, created = Subscription.objects.update_or_create(
-                tenant=tenant,
-                defaults={
-                    "plan": plan,
-                    "stripe_subscription_id": stripe_sub.id,
-                    "stripe_customer_id": tenant.stripe_customer_id,
-                    "status": stripe_sub.status,
-                    "current_period_start": datetime.fromtimestamp(
-                        stripe_sub.current_period_start, tz=timezone.utc
-                    ),
-                    "current_period_end": datetime.fromtimestamp(
-                        stripe_sub.current_period_end, tz=timezone.utc
-                    ),
-                    "cancel_at_period_end": stripe_sub.cancel_at_period_end,
-                },
-            )
+        plan = get_active_plan_by_price(price_id)
+        if plan is None:
+            try:
+                plan = SubscriptionPlan.objects.get(stripe_price_id=price_id)
+            except SubscriptionPlan.DoesNotExist:
+                raise ValueError(f"Plan not found for price: {price_id}")
+
+        defaults = {
+            "plan": plan,
+            "plan_display_name": plan.display_name,
+            "stripe_subscription_id": stripe_sub.id,
+            "stripe_customer_id": tenant.stripe_customer_id,
+            "status": stripe_sub.status,
+            **stripe_period_fields(stripe_sub),
+            "cancel_at_period_end": stripe_sub.cancel_at_period_end,
+        }
 
+        # A re-sync almost always finds an existing row, so issue a single
+        # UPDATE (no SELECT ... FOR UPDATE first) and only INSERT on a miss.
+        # update() bypasses auto_now, so updated_at is set explicitly.
+        subscriptions_for_tenant = Subscription.objects.filter(tenant=tenant)
+        if not subscriptions_for_tenant.update(**defaults, updated_at=timezone.now()):
+            try:
+                with transaction.atomic():
+                    return Subscription.objects.create(tenant=tenant, **defaults)
+            except IntegrityError:
+                # A concurrent sync inserted the row first; apply ours on top.
+                # No match means the Stripe subscription id is held by another
+                # tenant's row instead.
+                if not subscriptions_for_tenant.update(
+                    **defaults, updated_at=timezone.now()
+                ):
+                    raise ValueError(
+                        f"Stripe subscription {stripe_sub.id} belongs to "
+                        "another tenant"
+                    )
+
+        subscription = subscriptions_for_tenant.get()
+        subscription.plan = plan  # already loaded; spare the serializer a query
         return subscription
 
 
-# Singleton instance
-stripe_service = StripeService()
+@lru_cache(maxsize=1)
+def get_stripe_service() -> StripeService:
+    """
+    Return the shared StripeService instance.
+
+    Built on first use rather than at import time so settings are only
+    read once the app registry is ready.
+    """
+    return StripeService()
@@ -0,0 +1,22 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_plan_cache
+from .models import Subscription, SubscriptionPlan
+
+
+@receiver(post_save, sender=SubscriptionPlan)
+@receiver(post_delete, sender=SubscriptionPlan)
+def clear_plan_cache(sender, instance, **kwargs):
+    """Invalidate cached plan listings whenever a plan changes."""
+    # Invalidate after commit so a concurrent request cannot re-cache the old row
+    transaction.on_commit(invalidate_plan_cache)
+
+
+@receiver(post_save, sender=SubscriptionPlan)
+def sync_plan_display_name(sender, instance, **kwargs):
+    """Copy a renamed plan's display name onto its subscriptions."""
+    Subscription.objects.filter(plan=instance).exclude(
+        plan_display_name=instance.display_name
+    ).update(plan_display_name=instance.display_name)
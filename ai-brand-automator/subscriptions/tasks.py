@@ -0,0 +1,61 @@
+"""
+Celery tasks for the subscriptions app.
+"""
+import logging
+from datetime import timedelta
+
+import stripe
+from celery import shared_task
+from django.utils import timezone
+
+from .serializers import SubscriptionSerializer
+from .services import get_stripe_service
+
+logger = logging.getLogger(__name__)
+
+# Stripe stops redelivering an event after 3 days; keep ids well past that
+WEBHOOK_EVENT_RETENTION_DAYS = 30
+
+
+@shared_task(
+    bind=True,
+    name="subscriptions.sync_subscription",
+    autoretry_for=(stripe.error.APIConnectionError,),
+    retry_backoff=True,
+    max_retries=3,
+)
+def sync_subscription_task(self, tenant_id):
+    """
+    Celery task to sync a tenant's subscription from Stripe.
+    Runs the Stripe round-trip off the request path; the result is polled
+    via the sync status endpoint.
+    """
+    from tenants.models import Tenant
+
+    try:
+        tenant = Tenant.objects.get(id=tenant_id)
+        subscription = get_stripe_service().sync_subscription_from_stripe(tenant)
+    except Tenant.DoesNotExist:
+        logger.error(f"Tenant with id {tenant_id} not found")
+        return {"tenant_id": tenant_id, "error": "Tenant not found"}
+    except ValueError as e:
+        return {"tenant_id": tenant_id, "error": str(e)}
+
+    return {
+        "tenant_id": tenant_id,
+        "subscription": SubscriptionSerializer(subscription).data,
+    }
+
+
+@shared_task(name="subscriptions.prune_webhook_events")
+def prune_webhook_events():
+    """
+    Celery task to delete processed webhook event ids past their retention.
+    Stripe no longer redelivers them, so they are not needed for dedupe.
+    """
+    from .models import ProcessedWebhookEvent
+
+    cutoff = timezone.now() - timedelta(days=WEBHOOK_EVENT_RETENTION_DAYS)
+    deleted, _ = ProcessedWebhookEvent.objects.filter(created_at__lt=cutoff).delete()
+    logger.info(f"Pruned {deleted} processed webhook events")
+    return {"deleted": deleted}
@@ -0,0 +1,25 @@
+"""
+Shared fixtures for the subscriptions tests.
+"""
+import pytest
+from decimal import Decimal
+
+from subscriptions.models import SubscriptionPlan
+
+
+@pytest.fixture
+def subscription_plan(db):
+    """Create a test subscription plan."""
+    return SubscriptionPlan.objects.create(
+        name="basic",
+        display_name="Basic Test",
+        description="Test plan description",
+        price=Decimal("29.00"),
+        stripe_price_id="price_test_123",
+        max_brands=1,
+        max_team_members=1,
+        ai_generations_per_month=10,
+        automation_enabled=False,
+        priority_support=False,
+        is_active=True,
+    )
@@ -0,0 +1,69 @@
+"""
+Tests for the subscription models.
+"""
+import pytest
+from decimal import Decimal
+from django.utils import timezone
+
+from subscriptions.models import Subscription, SubscriptionPlan
+
+
+@pytest.mark.django_db
+class TestSubscriptionPlanModel:
+    """Tests for SubscriptionPlan model."""
+
+    def test_create_subscription_plan(self, subscription_plan):
+        """Test creating a subscription plan."""
+        assert subscription_plan.name == "basic"
+        assert subscription_plan.display_name == "Basic Test"
+        assert subscription_plan.price == Decimal("29.00")
+        assert subscription_plan.stripe_price_id == "price_test_123"
+        assert subscription_plan.is_active is True
+
+    def test_subscription_plan_str(self, subscription_plan):
+        """Test string representation."""
+        expected = "Basic Test - $29.00/mo"
+        assert str(subscription_plan) == expected
+
+
+@pytest.mark.django_db
+class TestSubscriptionModel:
+    """Tests for the Subscription model."""
+
+    def _subscription(self, tenant, plan):
+        return Subscription.objects.create(
+            tenant=tenant,
+            plan=plan,
+            stripe_subscription_id="sub_test123",
+            stripe_customer_id="cus_test123",
+            current_period_start=timezone.now(),
+            current_period_end=timezone.now(),
+        )
+
+    def test_plan_change_updates_display_name(self, subscription_plan, public_tenant):
+        """Test reassigning the plan refreshes the denormalized plan name."""
+        pro_plan = SubscriptionPlan.objects.create(
+            name="pro",
+            display_name="Pro Test",
+            price=Decimal("79.00"),
+            stripe_price_id="price_test_pro",
+        )
+        created = self._subscription(public_tenant, subscription_plan)
+        assert created.plan_display_name == "Basic Test"
+
+        subscription = Subscription.objects.get(pk=created.pk)
+        subscription.plan = pro_plan
+        subscription.save()
+
+        subscription.refresh_from_db()
+        assert subscription.plan_display_name == "Pro Test"
+
+    def test_plan_rename_updates_subscriptions(self, subscription_plan, public_tenant):
+        """Test renaming a plan updates the name stored on its subscriptions."""
+        subscription = self._subscription(public_tenant, subscription_plan)
+
+        subscription_plan.display_name = "Basic Renamed"
+        subscription_plan.save()
+
+        subscription.refresh_from_db()
+        assert subscription.plan_display_name == "Basic Renamed"
@@ -0,0 +1,295 @@
+"""
+Tests for StripeService and the subscription tasks.
+"""
+import pytest
+import responses
+import stripe
+import time
+from datetime import timedelta
+from django.core.cache import cache
+from django.utils import timezone
+from unittest.mock import patch, MagicMock
+
+from subscriptions.models import ProcessedWebhookEvent, Subscription
+from subscriptions.services import StripeService
+from subscriptions.tasks import prune_webhook_events
+
+
+STRIPE_API = "https://api.stripe.com"
+
+
+@pytest.fixture
+def stripe_api(settings, monkeypatch):
+    """Configure a Stripe key and intercept the SDK's HTTP calls.
+
+    Every registered response must be requested, and any unregistered
+    Stripe request fails the test. The global stripe.api_key, which
+    StripeService sets on init, is restored afterwards.
+    """
+    settings.STRIPE_SECRET_KEY = "sk_test_123"
+    monkeypatch.setattr(stripe, "api_key", "sk_test_123")
+    with responses.RequestsMock() as rsps:
+        yield rsps
+
+
+@pytest.fixture
+def mock_tenant():
+    """Create a mock tenant object."""
+    tenant = MagicMock()
+    tenant.id = 1
+    tenant.name = "Test Tenant"
+    tenant.stripe_customer_id = None
+    return tenant
+
+
+@pytest.mark.django_db
+class TestStripeService:
+    """Tests for StripeService."""
+
+    def test_service_initialization(self):
+        """Test that the service can be instantiated."""
+        service = StripeService()
+        assert service is not None
+
+    @patch("subscriptions.services.stripe.Webhook.construct_event")
+    def test_stale_webhook_rejected_before_hashing(self, mock_construct):
+        """Test replayed webhooks are rejected without verifying the HMAC."""
+        service = StripeService()
+
+        with pytest.raises(stripe.error.SignatureVerificationError):
+            service.handle_webhook_event(b"{}", "t=1000,v1=deadbeef")
+
+        mock_construct.assert_not_called()
+
+    @patch("subscriptions.services.stripe.Webhook.construct_event")
+    def test_duplicate_webhook_event_skipped(self, mock_construct):
+        """Test a redelivered event id is acknowledged but not reprocessed."""
+        mock_construct.return_value = {
+            "id": "evt_test123",
+            "type": "customer.created",
+            "data": {"object": {}},
+        }
+        service = StripeService()
+        sig_header = f"t={int(time.time())},v1=deadbeef"
+
+        first = service.handle_webhook_event(b"{}", sig_header)
+        # A redelivery may reach another worker, with a cold local cache
+        cache.clear()
+        second = service.handle_webhook_event(b"{}", sig_header)
+
+        assert first["status"] == "ignored"
+        assert second == {"status": "duplicate", "event_id": "evt_test123"}
+        assert ProcessedWebhookEvent.objects.filter(event_id="evt_test123").exists()
+
+    @patch("subscriptions.services.stripe.Webhook.construct_event")
+    def test_failed_webhook_event_processed_on_retry(self, mock_construct):
+        """Test a delivery that failed is not treated as a duplicate."""
+        mock_construct.return_value = {
+            "id": "evt_test456",
+            "type": "customer.created",
+            "data": {"object": {}},
+        }
+        service = StripeService()
+        sig_header = f"t={int(time.time())},v1=deadbeef"
+
+        with patch.object(service, "_process_event", side_effect=RuntimeError):
+            with pytest.raises(RuntimeError):
+                service.handle_webhook_event(b"{}", sig_header)
+
+        assert not ProcessedWebhookEvent.objects.filter(event_id="evt_test456").exists()
+        retry = service.handle_webhook_event(b"{}", sig_header)
+        assert retry["status"] == "ignored"
+
+    def test_prune_webhook_events_keeps_recent_ids(self):
+        """Test the cleanup task only deletes event ids past retention."""
+        ProcessedWebhookEvent.objects.create(event_id="evt_old", event_type="x")
+        ProcessedWebhookEvent.objects.create(event_id="evt_new", event_type="x")
+        ProcessedWebhookEvent.objects.filter(event_id="evt_old").update(
+            created_at=timezone.now() - timedelta(days=31)
+        )
+
+        result = prune_webhook_events.run()
+
+        assert result == {"deleted": 1}
+        assert list(
+            ProcessedWebhookEvent.objects.values_list("event_id", flat=True)
+        ) == ["evt_new"]
+
+    def test_sync_updates_existing_subscription(
+        self, stripe_api, subscription_plan, public_tenant
+    ):
+        """Test re-syncing updates the tenant's existing subscription row."""
+        public_tenant.stripe_customer_id = "cus_test123"
+        existing = Subscription.objects.create(
+            tenant=public_tenant,
+            plan=subscription_plan,
+            stripe_subscription_id="sub_test123",
+            stripe_customer_id="cus_test123",
+            status="incomplete",
+            current_period_start=timezone.now(),
+            current_period_end=timezone.now(),
+        )
+        stripe_api.get(
+            f"{STRIPE_API}/v1/subscriptions",
+            json={
+                "object": "list",
+                "data": [
+                    {
+                        "id": "sub_test123",
+                        "object": "subscription",
+                        "status": "active",
+                        "current_period_start": 1700000000,
+                        "current_period_end": 1702592000,
+                        "cancel_at_period_end": False,
+                        "items": {
+                            "object": "list",
+                            "data": [{"price": {"id": "price_test_123"}}],
+                        },
+                    }
+                ],
+            },
+        )
+
+        subscription = StripeService().sync_subscription_from_stripe(public_tenant)
+
+        assert subscription.id == existing.id
+        assert subscription.status == "active"
+        assert subscription.plan_display_name == "Basic Test"
+        assert Subscription.objects.filter(tenant=public_tenant).count() == 1
+
+    def test_sync_rejects_subscription_of_another_tenant(
+        self, stripe_api, subscription_plan, public_tenant, tenant
+    ):
+        """Test syncing a Stripe subscription held by another tenant's row."""
+        public_tenant.stripe_customer_id = "cus_test123"
+        Subscription.objects.create(
+            tenant=tenant,
+            plan=subscription_plan,
+            stripe_subscription_id="sub_test123",
+            stripe_customer_id="cus_other",
+            status="active",
+            current_period_start=timezone.now(),
+            current_period_end=timezone.now(),
+        )
+        stripe_api.get(
+            f"{STRIPE_API}/v1/subscriptions",
+            json={
+                "object": "list",
+                "data": [
+                    {
+                        "id": "sub_test123",
+                        "object": "subscription",
+                        "status": "active",
+                        "current_period_start": 1700000000,
+                        "current_period_end": 1702592000,
+                        "cancel_at_period_end": False,
+                        "items": {
+                            "object": "list",
+                            "data": [{"price": {"id": "price_test_123"}}],
+                        },
+                    }
+                ],
+            },
+        )
+
+        with pytest.raises(ValueError, match="belongs to another tenant"):
+            StripeService().sync_subscription_from_stripe(public_tenant)
+
+        assert not Subscription.objects.filter(tenant=public_tenant).exists()
+
+    def test_sync_caches_missing_subscription(self, stripe_api, public_tenant):
+        """Test a tenant with no Stripe subscription is not re-queried."""
+        public_tenant.stripe_customer_id = "cus_test123"
+        stripe_api.get(
+            f"{STRIPE_API}/v1/subscriptions",
+            json={"object": "list", "data": []},
+        )
+        service = StripeService()
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match="No subscription found"):
+                service.sync_subscription_from_stripe(public_tenant)
+
+        assert len(stripe_api.calls) == 1
+
+    def test_create_customer(self, stripe_api, mock_tenant):
+        """Test creating a Stripe customer."""
+        stripe_api.post(
+            f"{STRIPE_API}/v1/customers",
+            json={"id": "cus_test123", "object": "customer"},
+        )
+
+        service = StripeService()
+        customer = service.create_customer(mock_tenant, "test@example.com")
+
+        assert customer.id == "cus_test123"
+        assert mock_tenant.stripe_customer_id == "cus_test123"
+        mock_tenant.save.assert_called_once()
+
+    def test_create_checkout_session(self, stripe_api, subscription_plan, mock_tenant):
+        """Test creating a checkout session."""
+        mock_tenant.stripe_customer_id = "cus_existing"
+        stripe_api.get(
+            f"{STRIPE_API}/v1/customers/cus_existing",
+            json={"id": "cus_existing", "object": "customer"},
+        )
+        stripe_api.post(
+            f"{STRIPE_API}/v1/checkout/sessions",
+            json={
+                "id": "cs_test123",
+                "object": "checkout.session",
+                "url": "https://checkout.stripe.com/test",
+            },
+        )
+
+        service = StripeService()
+        session = service.create_checkout_session(
+            tenant=mock_tenant,
+            plan=subscription_plan,
+            success_url="https://example.com/success",
+            cancel_url="https://example.com/cancel",
+            email="test@example.com",
+        )
+
+        assert session.id == "cs_test123"
+        assert session.url == "https://checkout.stripe.com/test"
+
+    def test_create_portal_session(self, stripe_api, mock_tenant):
+        """Test creating a billing portal session."""
+        mock_tenant.stripe_customer_id = "cus_test123"
+        stripe_api.post(
+            f"{STRIPE_API}/v1/billing_portal/sessions",
+            json={
+                "id": "bps_test123",
+                "object": "billing_portal.session",
+                "url": "https://billing.stripe.com/portal",
+            },
+        )
+
+        service = StripeService()
+        session = service.create_portal_session(
+            tenant=mock_tenant,
+            return_url="https://example.com/billing",
+        )
+
+        assert session.url == "https://billing.stripe.com/portal"
+
+    def test_cancel_subscription(self, stripe_api):
+        """Test canceling a subscription."""
+        mock_subscription = MagicMock()
+        mock_subscription.stripe_subscription_id = "sub_test123"
+        stripe_api.post(
+            f"{STRIPE_API}/v1/subscriptions/sub_test123",
+            json={
+                "id": "sub_test123",
+                "object": "subscription",
+                "cancel_at_period_end": True,
+            },
+        )
+
+        service = StripeService()
+        result = service.cancel_subscription(mock_subscription)
+
+        assert result.cancel_at_period_end is True
+        assert stripe_api.calls[0].request.body == "cancel_at_period_end=True"
+        mock_subscription.save.assert_called_once()
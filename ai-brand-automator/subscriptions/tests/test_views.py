@@ -0,0 +1,277 @@
+"""
+Tests for the subscription API views.
+"""
+import io
+import pytest
+from decimal import Decimal
+from rest_framework import status
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.test import APIRequestFactory
+from unittest.mock import patch, MagicMock
+
+from subscriptions.models import PaymentHistory, SubscriptionPlan
+from subscriptions.tasks import sync_subscription_task
+from subscriptions.views import StripeWebhookView
+from tenants.models import Domain
+
+# Use the api_client fixture from conftest.py which has SERVER_NAME set
+
+
+@pytest.mark.django_db
+class TestSubscriptionPlanAPI:
+    """Tests for subscription plan API endpoints."""
+
+    def test_list_plans(self, api_client, subscription_plan):
+        """Test listing subscription plans."""
+        url = "/api/v1/subscriptions/plans/"
+        response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] >= 1
+
+    def test_retrieve_plan(self, api_client, subscription_plan):
+        """Test retrieving a specific plan."""
+        url = f"/api/v1/subscriptions/plans/{subscription_plan.id}/"
+        response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["name"] == "basic"
+        assert response.data["display_name"] == "Basic Test"
+
+    def test_list_plans_is_cached(self, api_client, subscription_plan):
+        """Test the plan list is served from cache after the first request."""
+        url = "/api/v1/subscriptions/plans/"
+        api_client.get(url)
+
+        # Bypass signals so only the cache can explain the stale response
+        SubscriptionPlan.objects.filter(pk=subscription_plan.pk).update(
+            display_name="Renamed"
+        )
+        response = api_client.get(url)
+
+        assert response.data["results"][0]["display_name"] == "Basic Test"
+
+    def test_cached_plan_links_use_request_host(
+        self, api_client, subscription_plan, public_tenant
+    ):
+        """Test cached plan pages link to the host of each request."""
+        SubscriptionPlan.objects.create(
+            name="pro", display_name="Pro", price=Decimal("79.00"), stripe_price_id="p"
+        )
+        Domain.objects.create(domain="127.0.0.1", tenant=public_tenant)
+        url = "/api/v1/subscriptions/plans/"
+
+        with patch.object(PageNumberPagination, "page_size", 1):
+            first = api_client.get(url)
+            second = api_client.get(url, SERVER_NAME="127.0.0.1")
+
+        assert first.data["next"] == f"http://localhost{url}?page=2"
+        assert second.data["next"] == f"http://127.0.0.1{url}?page=2"
+        assert second.data["results"] == first.data["results"]
+
+    def test_later_plan_pages_served_from_cache(self, api_client, subscription_plan):
+        """Test every page is paginated from the cached plan list."""
+        pro = SubscriptionPlan.objects.create(
+            name="pro", display_name="Pro", price=Decimal("79.00"), stripe_price_id="p"
+        )
+        url = "/api/v1/subscriptions/plans/"
+
+        with patch.object(PageNumberPagination, "page_size", 1):
+            api_client.get(url)
+            SubscriptionPlan.objects.filter(pk=pro.pk).update(display_name="Renamed")
+            response = api_client.get(url, {"page": 2})
+
+        assert response.data["count"] == 2
+        assert response.data["results"][0]["display_name"] == "Pro"
+        assert response.data["previous"] == f"http://localhost{url}"
+
+    def test_plan_save_invalidates_cache(
+        self, api_client, subscription_plan, django_capture_on_commit_callbacks
+    ):
+        """Test saving a plan clears the cached plan list once committed."""
+        url = "/api/v1/subscriptions/plans/"
+        api_client.get(url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            subscription_plan.display_name = "Renamed"
+            subscription_plan.save()
+            stale = api_client.get(url)
+        response = api_client.get(url)
+
+        assert stale.data["results"][0]["display_name"] == "Basic Test"
+
+        assert response.data["results"][0]["display_name"] == "Renamed"
+
+    def test_plans_are_read_only(self, api_client, subscription_plan):
+        """Test that plans cannot be created via API."""
+        url = "/api/v1/subscriptions/plans/"
+        data = {
+            "name": "test",
+            "display_name": "Test Plan",
+            "price": "99.00",
+            "stripe_price_id": "price_new",
+        }
+        response = api_client.post(url, data)
+
+        # Should be method not allowed (read-only viewset)
+        assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
+
+
+@pytest.mark.django_db
+class TestCreateCheckoutSessionAPI:
+    """Tests for the checkout session endpoint."""
+
+    url = "/api/v1/subscriptions/create-checkout-session/"
+
+    def _payload(self, plan_id):
+        return {
+            "plan_id": plan_id,
+            "success_url": "https://example.com/success",
+            "cancel_url": "https://example.com/cancel",
+        }
+
+    def test_inactive_plan_not_found(self, authenticated_client, subscription_plan):
+        """Test checkout is refused for a plan that has been deactivated."""
+        subscription_plan.is_active = False
+        subscription_plan.save()
+
+        response = authenticated_client.post(
+            self.url, self._payload(subscription_plan.id), format="json"
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.data["error"] == "Plan not found"
+
+
+@pytest.mark.django_db
+class TestPaymentHistoryAPI:
+    """Tests for the payment history endpoint."""
+
+    def test_lists_latest_payments_first(self, authenticated_client, public_tenant):
+        """Test payments are returned newest first with serializer fields."""
+        for amount in ("10.00", "20.00", "30.00"):
+            PaymentHistory.objects.create(
+                tenant=public_tenant,
+                amount=Decimal(amount),
+                status="succeeded",
+                description="Subscription payment",
+            )
+
+        response = authenticated_client.get("/api/v1/subscriptions/payments/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [p["amount"] for p in response.data] == ["30.00", "20.00", "10.00"]
+        assert set(response.data[0]) == {
+            "id",
+            "amount",
+            "currency",
+            "status",
+            "description",
+            "created_at",
+        }
+
+
+@pytest.mark.django_db
+class TestStripeWebhookAPI:
+    """Tests for the Stripe webhook endpoint."""
+
+    url = "/api/v1/subscriptions/webhook/"
+
+    @patch("subscriptions.views.get_stripe_service")
+    def test_oversized_payload_rejected(self, mock_get_service, api_client):
+        """Test payloads over the size cap are refused before processing."""
+        payload = b"x" * (1024 * 1024 + 1)
+
+        response = api_client.generic(
+            "POST", self.url, payload, content_type="application/json"
+        )
+
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        mock_get_service.assert_not_called()
+
+    @patch("subscriptions.views.get_stripe_service")
+    def test_oversized_payload_without_content_length_rejected(self, mock_get_service):
+        """Test the size cap also holds for bodies sent without a length."""
+        request = APIRequestFactory().post(self.url)
+        # As with a chunked upload, the length is only known by reading
+        request.META.pop("CONTENT_LENGTH", None)
+        request._stream = io.BytesIO(b"x" * (1024 * 1024 + 1))
+
+        response = StripeWebhookView.as_view()(request)
+
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        mock_get_service.assert_not_called()
+
+
+@pytest.mark.django_db
+class TestSyncSubscription:
+    """Tests for the background subscription sync."""
+
+    url = "/api/v1/subscriptions/sync/"
+
+    def test_sync_without_customer_returns_404(
+        self, authenticated_client, public_tenant
+    ):
+        """Test sync is refused before queueing when there is no customer."""
+        public_tenant.stripe_customer_id = None
+        public_tenant.save()
+
+        with patch("subscriptions.views.sync_subscription_task.delay") as mock_delay:
+            response = authenticated_client.post(self.url, {}, format="json")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        mock_delay.assert_not_called()
+
+    def test_sync_queues_task(self, authenticated_client, public_tenant):
+        """Test sync enqueues the Celery task and returns 202 with its id."""
+        public_tenant.stripe_customer_id = "cus_test123"
+        public_tenant.save()
+
+        with patch("subscriptions.views.sync_subscription_task.delay") as mock_delay:
+            mock_delay.return_value = MagicMock(id="task-123")
+            response = authenticated_client.post(self.url, {}, format="json")
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.data["task_id"] == "task-123"
+        mock_delay.assert_called_once_with(public_tenant.id)
+
+    def test_sync_result_pending(self, authenticated_client):
+        """Test polling an unfinished task reports its state."""
+        with patch(
+            "subscriptions.views.sync_subscription_task.AsyncResult"
+        ) as mock_result:
+            mock_result.return_value = MagicMock(
+                state="PENDING", ready=MagicMock(return_value=False)
+            )
+            response = authenticated_client.get(f"{self.url}task-123/")
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.data["state"] == "PENDING"
+
+    def test_sync_result_hides_other_tenants(self, authenticated_client, public_tenant):
+        """Test a finished task for another tenant is not exposed."""
+        with patch(
+            "subscriptions.views.sync_subscription_task.AsyncResult"
+        ) as mock_result:
+            mock_result.return_value = MagicMock(
+                ready=MagicMock(return_value=True),
+                failed=MagicMock(return_value=False),
+                result={"tenant_id": public_tenant.id + 1, "subscription": {}},
+            )
+            response = authenticated_client.get(f"{self.url}task-123/")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    @patch("subscriptions.tasks.get_stripe_service")
+    def test_task_reports_sync_errors(self, mock_get_service, public_tenant):
+        """Test the task returns Stripe lookup errors instead of raising."""
+        mock_get_service.return_value.sync_subscription_from_stripe.side_effect = (
+            ValueError("No subscription found in Stripe")
+        )
+
+        result = sync_subscription_task.run(public_tenant.id)
+
+        assert result == {
+            "tenant_id": public_tenant.id,
+            "error": "No subscription found in Stripe",
+        }
@@ -2,37 +2,44 @@
 URL patterns for subscription endpoints.
 """
 from django.urls import path, include
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 
 from .views import (
     SubscriptionPlanViewSet,
-    get_subscription_status,
-    create_checkout_session,
-    create_portal_session,
-    cancel_subscription,
-    get_payment_history,
-    stripe_webhook,
-    sync_subscription,
+    SubscriptionStatusView,
+    CreateCheckoutSessionView,
+    CreatePortalSessionView,
+    CancelSubscriptionView,
+    PaymentHistoryView,
+    StripeWebhookView,
+    SyncSubscriptionView,
+    SyncSubscriptionResultView,
 )
 
-router = DefaultRouter()
+# SimpleRouter: the subscriptions prefix needs no browsable API root view
+router = SimpleRouter()
 router.register(r"plans", SubscriptionPlanViewSet, basename="subscriptionplan")
 
 urlpatterns = [
     path("", include(router.urls)),
-    path("status/", get_subscription_status, name="subscription_status"),
+    path("status/", SubscriptionStatusView.as_view(), name="subscription_status"),
     path(
         "create-checkout-session/",
-        create_checkout_session,
+        CreateCheckoutSessionView.as_view(),
         name="create_checkout_session",
     ),
     path(
         "create-portal-session/",
-        create_portal_session,
+        CreatePortalSessionView.as_view(),
         name="create_portal_session",
     ),
-    path("cancel/", cancel_subscription, name="cancel_subscription"),
-    path("payments/", get_payment_history, name="payment_history"),
-    path("webhook/", stripe_webhook, name="stripe_webhook"),
-    path("sync/", sync_subscription, name="sync_subscription"),
+    path("cancel/", CancelSubscriptionView.as_view(), name="cancel_subscription"),
+    path("payments/", PaymentHistoryView.as_view(), name="payment_history"),
+    path("webhook/", StripeWebhookView.as_view(), name="stripe_webhook"),
+    path("sync/", SyncSubscriptionView.as_view(), name="sync_subscription"),
+    path(
+        "sync/<str:task_id>/",
+        SyncSubscriptionResultView.as_view(),
+        name="sync_subscription_result",
+    ),
 ]
@@ -2,12 +2,14 @@
 Views for subscription management.
 """
 from rest_framework import status, viewsets
-from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
-from django.views.decorators.csrf import csrf_exempt
+from rest_framework.views import APIView
 import logging
 
+from tenants.cache import get_public_tenant
+from tenants.models import Tenant
+
 from .models import SubscriptionPlan, Subscription, PaymentHistory
 from .serializers import (
     SubscriptionPlanSerializer,
@@ -16,288 +18,423 @@ from .serializers import (
     CreateCheckoutSessionSerializer,
     CreatePortalSessionSerializer,
 )
-from .services import stripe_service
+from .cache import (
+    get_active_plan,
+    get_cached_plans,
+    has_no_subscription,
+    set_cached_plans,
+)
+from .services import get_stripe_service
+from .tasks import sync_subscription_task
 
 logger = logging.getLogger(__name__)
 
+# Columns read by SubscriptionSerializer, including its nested plan
+SUBSCRIPTION_FIELDS = (
+    "id",
+    "status",
+    "current_period_start",
+    "current_period_end",
+    "cancel_at_period_end",
+    "created_at",
+    "plan",
+    *(f"plan__{field}" for field in SubscriptionPlanSerializer.Meta.fields),
+)
+# Columns StripeService.cancel_subscription reads or writes
+SUBSCRIPTION_CANCEL_FIELDS = (
+    "id",
+    "stripe_subscription_id",
+    "cancel_at_period_end",
+)
+
+
+def _get_request_tenant(request):
+    """
+    Return the tenant for the request.
+
+    MVP mode: falls back to the (cached) public tenant when the tenant
+    middleware did not attach one. Returns None if neither exists.
+    """
+    tenant = getattr(request, "tenant", None)
+    if tenant:
+        return tenant
+
+    try:
+        return get_public_tenant()
+    except Tenant.DoesNotExist:
+        return None
+
 
 class SubscriptionPlanViewSet(viewsets.ReadOnlyModelViewSet):
     """ViewSet for listing subscription plans"""
 
-    queryset = SubscriptionPlan.objects.filter(is_active=True)
+    # SubscriptionPlan has no relations to join; only load the columns the
+    # serializer renders and order by a unique tail so pages are stable.
+    queryset = (
+        SubscriptionPlan.objects.filter(is_active=True)
+        .only(*SubscriptionPlanSerializer.Meta.fields)
+        .order_by("price", "id")
+    )
     serializer_class = SubscriptionPlanSerializer
     permission_classes = [AllowAny]  # Plans are public
 
+    def list(self, request, *args, **kwargs):
+        # Every visitor sees the same handful of active plans, so cache them
+        # serialized and paginate the cached list in memory; next/previous
+        # links are built per request and carry its host and scheme.
+        plans = get_cached_plans()
+        if plans is None:
+            queryset = self.filter_queryset(self.get_queryset())
+            plans = self.get_serializer(queryset, many=True).data
+            set_cached_plans(plans)
+
+        page = self.paginate_queryset(plans)
+        if page is not None:
+            return self.get_paginated_response(page)
+        return Response(plans)
+
 
-@api_view(["GET"])
-@permission_classes([IsAuthenticated])
-def get_subscription_status(request):
+class SubscriptionStatusView(APIView):
     """Get current subscription status for the tenant"""
-    tenant = getattr(request, "tenant", None)
 
-    if not tenant:
-        # MVP mode - try to get tenant from user
-        from tenants.models import Tenant
+    permission_classes = [IsAuthenticated]
 
-        try:
-            tenant = Tenant.objects.get(schema_name="public")
-        except Tenant.DoesNotExist:
+    def get(self, request):
+        tenant = _get_request_tenant(request)
+        if not tenant:
             return Response(
                 {"error": "Tenant not found"},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-    try:
-        subscription = Subscription.objects.get(tenant=tenant)
-        serializer = SubscriptionSerializer(subscription)
-        return Response(serializer.data)
-    except Subscription.DoesNotExist:
-        return Response(
-            {
-                "status": "none",
-                "message": "No active subscription",
-                "plans_url": "/api/v1/subscriptions/plans/",
-            }
-        )
+        try:
+            # SubscriptionSerializer nests the plan; join it in the same query
+            subscription = (
+                Subscription.objects.select_related("plan")
+                .only(*SUBSCRIPTION_FIELDS)
+                .get(tenant=tenant)
+            )
+            serializer = SubscriptionSerializer(subscription)
+            return Response(serializer.data)
+        except Subscription.DoesNotExist:
+            return Response(
+                {
+                    "status": "none",
+                    "message": "No active subscription",
+                    "plans_url": "/api/v1/subscriptions/plans/",
+                }
+            )
 
 
-@api_view(["POST"])
-@permission_classes([IsAuthenticated])
-def create_checkout_session(request):
+class CreateCheckoutSessionView(APIView):
     """Create a Stripe Checkout session for subscription"""
-    serializer = CreateCheckoutSessionSerializer(data=request.data)
-    if not serializer.is_valid():
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-    tenant = getattr(request, "tenant", None)
-    if not tenant:
-        from tenants.models import Tenant
+    permission_classes = [IsAuthenticated]
 
-        try:
-            tenant = Tenant.objects.get(schema_name="public")
-        except Tenant.DoesNotExist:
+    def post(self, request):
+        serializer = CreateCheckoutSessionSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        tenant = _get_request_tenant(request)
+        if not tenant:
             return Response(
                 {"error": "Tenant not found"},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-    try:
-        plan = SubscriptionPlan.objects.get(
-            id=serializer.validated_data["plan_id"],
-            is_active=True,
-        )
-    except SubscriptionPlan.DoesNotExist:
-        return Response(
-            {"error": "Plan not found"},
-            status=status.HTTP_404_NOT_FOUND,
-        )
-
-    try:
-        session = stripe_service.create_checkout_session(
-            tenant=tenant,
-            plan=plan,
-            success_url=serializer.validated_data["success_url"],
-            cancel_url=serializer.validated_data["cancel_url"],
-            email=request.user.email,
-        )
-
-        if session:
+        plan = get_active_plan(serializer.validated_data["plan_id"])
+        if plan is None:
             return Response(
-                {
-                    "checkout_url": session.url,
-                    "session_id": session.id,
-                }
+                {"error": "Plan not found"},
+                status=status.HTTP_404_NOT_FOUND,
             )
-        else:
-            return Response(
-                {"error": "Stripe not configured"},
-                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+
+        try:
+            session = get_stripe_service().create_checkout_session(
+                tenant=tenant,
+                plan=plan,
+                success_url=serializer.validated_data["success_url"],
+                cancel_url=serializer.validated_data["cancel_url"],
+                email=request.user.email,
             )
 
-    except Exception as e:
-        logger.error(f"Checkout session creation failed: {e}")
-        return Response(
-            {"error": str(e)},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        )
+            if session:
+                return Response(
+                    {
+                        "checkout_url": session.url,
+                        "session_id": session.id,
+                    }
+                )
+            else:
+                return Response(
+                    {"error": "Stripe not configured"},
+                    status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                )
+
+        except Exception as e:
+            logger.error(f"Checkout session creation failed: {e}")
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
 
 
-@api_view(["POST"])
-@permission_classes([IsAuthenticated])
-def create_portal_session(request):
+class CreatePortalSessionView(APIView):
     """Create a Stripe Customer Portal session"""
-    serializer = CreatePortalSessionSerializer(data=request.data)
-    if not serializer.is_valid():
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-    tenant = getattr(request, "tenant", None)
-    if not tenant:
-        from tenants.models import Tenant
+    permission_classes = [IsAuthenticated]
 
-        try:
-            tenant = Tenant.objects.get(schema_name="public")
-        except Tenant.DoesNotExist:
+    def post(self, request):
+        serializer = CreatePortalSessionSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        tenant = _get_request_tenant(request)
+        if not tenant:
             return Response(
                 {"error": "Tenant not found"},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-    if not tenant.stripe_customer_id:
-        return Response(
-            {"error": "No billing account found. Please subscribe first."},
-            status=status.HTTP_400_BAD_REQUEST,
-        )
+        if not tenant.stripe_customer_id:
+            return Response(
+                {"error": "No billing account found. Please subscribe first."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-    try:
-        session = stripe_service.create_portal_session(
-            tenant=tenant,
-            return_url=serializer.validated_data["return_url"],
-        )
+        try:
+            session = get_stripe_service().create_portal_session(
+                tenant=tenant,
+                return_url=serializer.validated_data["return_url"],
+            )
+
+            if session:
+                return Response({"portal_url": session.url})
+            else:
+                return Response(
+                    {"error": "Stripe not configured"},
+                    status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                )
 
-        if session:
-            return Response({"portal_url": session.url})
-        else:
+        except Exception as e:
+            logger.error(f"Portal session creation failed: {e}")
             return Response(
-                {"error": "Stripe not configured"},
-                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                {"error": str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
-    except Exception as e:
-        logger.error(f"Portal session creation failed: {e}")
-        return Response(
-            {"error": str(e)},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        )
-
 
-@api_view(["POST"])
-@permission_classes([IsAuthenticated])
-def cancel_subscription(request):
+class CancelSubscriptionView(APIView):
     """Cancel the current subscription"""
-    tenant = getattr(request, "tenant", None)
-    if not tenant:
-        from tenants.models import Tenant
 
-        try:
-            tenant = Tenant.objects.get(schema_name="public")
-        except Tenant.DoesNotExist:
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        tenant = _get_request_tenant(request)
+        if not tenant:
             return Response(
                 {"error": "Tenant not found"},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-    try:
-        subscription = Subscription.objects.get(tenant=tenant)
-    except Subscription.DoesNotExist:
-        return Response(
-            {"error": "No subscription found"},
-            status=status.HTTP_404_NOT_FOUND,
-        )
+        try:
+            subscription = Subscription.objects.only(*SUBSCRIPTION_CANCEL_FIELDS).get(
+                tenant=tenant
+            )
+        except Subscription.DoesNotExist:
+            return Response(
+                {"error": "No subscription found"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
 
-    at_period_end = request.data.get("at_period_end", True)
-    # Validate at_period_end is a boolean
-    if not isinstance(at_period_end, bool):
-        return Response(
-            {"detail": "at_period_end must be a boolean"},
-            status=status.HTTP_400_BAD_REQUEST,
-        )
+        at_period_end = request.data.get("at_period_end", True)
+        # Validate at_period_end is a boolean
+        if not isinstance(at_period_end, bool):
+            return Response(
+                {"detail": "at_period_end must be a boolean"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-    try:
-        stripe_service.cancel_subscription(subscription, at_period_end=at_period_end)
-        return Response(
-            {
-                "message": "Subscription will be canceled"
-                + (" at period end" if at_period_end else " immediately"),
-                "cancel_at_period_end": at_period_end,
-            }
-        )
-    except Exception as e:
-        logger.error(f"Subscription cancellation failed: {e}")
-        return Response(
-            {"error": str(e)},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        )
+        try:
+            get_stripe_service().cancel_subscription(
+                subscription, at_period_end=at_period_end
+            )
+            return Response(
+                {
+                    "message": "Subscription will be canceled"
+                    + (" at period end" if at_period_end else " immediately"),
+                    "cancel_at_period_end": at_period_end,
+                }
+            )
+        except Exception as e:
+            logger.error(f"Subscription cancellation failed: {e}")
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
 
 
-@api_view(["GET"])
-@permission_classes([IsAuthenticated])
-def get_payment_history(request):
+class PaymentHistoryView(APIView):
     """Get payment history for the tenant"""
-    tenant = getattr(request, "tenant", None)
-    if not tenant:
-        from tenants.models import Tenant
 
-        try:
-            tenant = Tenant.objects.get(schema_name="public")
-        except Tenant.DoesNotExist:
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        tenant = _get_request_tenant(request)
+        if not tenant:
             return Response(
                 {"error": "Tenant not found"},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-    payments = PaymentHistory.objects.filter(tenant=tenant)[:20]
-    serializer = PaymentHistorySerializer(payments, many=True)
-    return Response(serializer.data)
+        payments = (
+            PaymentHistory.objects.filter(tenant=tenant)
+            .only(*PaymentHistorySerializer.Meta.fields)
+            .order_by("-created_at")[:20]
+        )
+        serializer = PaymentHistorySerializer(payments, many=True)
+        return Response(serializer.data)
 
 
-@csrf_exempt
-@api_view(["POST"])
-@permission_classes([AllowAny])
-def stripe_webhook(request):
+class StripeWebhookView(APIView):
     """Handle Stripe webhook events"""
-    payload = request.body
-    sig_header = request.META.get("HTTP_STRIPE_SIGNATURE", "")
 
-    try:
-        result = stripe_service.handle_webhook_event(payload, sig_header)
-        return Response(result)
-    except ValueError as e:
-        logger.error(f"Webhook error: {e}")
+    permission_classes = [AllowAny]
+    # Stripe authenticates with the signature header, not a user token
+    authentication_classes = []
+
+    # Stripe event payloads are well under this; anything larger is rejected
+    # without reading more than this much of the body into memory
+    MAX_PAYLOAD_SIZE = 1024 * 1024  # 1 MB
+
+    def post(self, request):
+        try:
+            content_length = int(request.META.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            content_length = 0
+        if content_length > self.MAX_PAYLOAD_SIZE:
+            return self._payload_too_large(content_length)
+
+        # construct_event needs the exact raw bytes to verify the signature.
+        # Read one byte past the cap so bodies sent without a Content-Length
+        # (chunked) are held to it too, rather than read in full.
+        payload = request.read(self.MAX_PAYLOAD_SIZE + 1)
+        if len(payload) > self.MAX_PAYLOAD_SIZE:
+            return self._payload_too_large(f"over {self.MAX_PAYLOAD_SIZE}")
+        sig_header = request.META.get("HTTP_STRIPE_SIGNATURE", "")
+
+        try:
+            result = get_stripe_service().handle_webhook_event(payload, sig_header)
+            return Response(result)
+        except ValueError as e:
+            logger.error(f"Webhook error: {e}")
+            return Response(
+                {"detail": "Invalid Stripe webhook payload."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        except Exception as e:
+            logger.exception(f"Webhook processing error: {e}")
+            return Response(
+                {"detail": "Error processing Stripe webhook."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+    def _payload_too_large(self, size):
+        logger.warning(f"Rejected oversized Stripe webhook: {size} bytes")
         return Response(
-            {"detail": "Invalid Stripe webhook payload."},
-            status=status.HTTP_400_BAD_REQUEST,
+            {"detail": "Stripe webhook payload too large."},
+            status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
         )
-    except Exception as e:
-        logger.exception(f"Webhook processing error: {e}")
+
+
+class SyncSubscriptionView(APIView):
+    """
+    Start syncing subscription status from Stripe (for after checkout).
+    The Stripe call runs in a Celery task; poll SyncSubscriptionResultView.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        tenant = _get_request_tenant(request)
+        if not tenant:
+            return Response(
+                {"detail": "Tenant not found"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        if not tenant.stripe_customer_id:
+            return Response(
+                {"detail": "No Stripe customer associated with this account"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        if has_no_subscription(tenant.id):
+            return Response(
+                {"detail": "No subscription found in Stripe"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        try:
+            task = sync_subscription_task.delay(tenant.id)
+        except Exception as e:
+            logger.exception(f"Error queueing subscription sync: {e}")
+            return Response(
+                {"detail": "Error syncing subscription from Stripe."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
         return Response(
-            {"detail": "Error processing Stripe webhook."},
-            status=status.HTTP_400_BAD_REQUEST,
+            {"message": "Subscription sync started", "task_id": task.id},
+            status=status.HTTP_202_ACCEPTED,
         )
 
 
-@api_view(["POST"])
-@permission_classes([IsAuthenticated])
-def sync_subscription(request):
-    """Sync subscription status from Stripe (for after checkout)"""
-    tenant = getattr(request, "tenant", None)
-    if not tenant:
-        from tenants.models import Tenant
+class SyncSubscriptionResultView(APIView):
+    """Poll the outcome of a subscription sync task"""
 
-        try:
-            tenant = Tenant.objects.get(schema_name="public")
-        except Tenant.DoesNotExist:
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, task_id):
+        tenant = _get_request_tenant(request)
+        if not tenant:
             return Response(
                 {"detail": "Tenant not found"},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-    try:
-        subscription = stripe_service.sync_subscription_from_stripe(tenant)
-        serializer = SubscriptionSerializer(subscription)
+        result = sync_subscription_task.AsyncResult(task_id)
+        if not result.ready():
+            return Response(
+                {"task_id": task_id, "state": result.state},
+                status=status.HTTP_202_ACCEPTED,
+            )
+
+        if result.failed():
+            logger.error(f"Subscription sync task {task_id} failed: {result.result}")
+            return Response(
+                {"detail": "Error syncing subscription from Stripe."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        data = result.result or {}
+        # Results are keyed by task id only; never hand one tenant another's data
+        if data.get("tenant_id") != tenant.id:
+            return Response(
+                {"detail": "Sync task not found"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        if "error" in data:
+            return Response(
+                {"detail": data["error"]},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
         return Response(
             {
                 "message": "Subscription synced successfully",
-                "subscription": serializer.data,
+                "subscription": data["subscription"],
             }
         )
-    except ValueError as e:
-        return Response(
-            {"detail": str(e)},
-            status=status.HTTP_404_NOT_FOUND,
-        )
-    except Exception as e:
-        logger.exception(f"Error syncing subscription: {e}")
-        return Response(
-            {"detail": "Error syncing subscription from Stripe."},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        )
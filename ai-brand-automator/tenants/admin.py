@@ -1,11 +1,40 @@
+import re
+
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from django.core.paginator import Paginator
+from django.db.models import OuterRef, Subquery
+from django.utils.functional import cached_property
 
 # from django.contrib.auth.admin import UserAdmin
 # from django_tenants.admin import TenantAdminMixin  # Temporarily disabled
+from .cache import get_cached_count
 from .models import Tenant, Domain
 
 # from .models import User
 
+# A single search term shaped like a hostname, e.g. "acme.localhost"
+HOSTNAME_SEARCH = re.compile(r"[a-z0-9-]+(\.[a-z0-9-]+)+", re.IGNORECASE)
+
+
+class CachedCountPaginator(Paginator):
+    """Paginator that reuses a cached row count between changelist renders."""
+
+    @cached_property
+    def count(self):
+        return get_cached_count(self.object_list)
+
+
+class TenantChangeList(ChangeList):
+    """Changelist that skips columns the tenant list never displays."""
+
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .only("name", "subscription_status", "created_at", "updated_at")
+        )
+
 
 @admin.register(Tenant)
 class TenantAdmin(admin.ModelAdmin):  # TenantAdminMixin temporarily disabled
@@ -18,12 +47,30 @@ class TenantAdmin(admin.ModelAdmin):  # TenantAdminMixin temporarily disabled
     list_filter = ("subscription_status", "created_at")
     search_fields = ("name",)
     readonly_fields = ("created_at", "updated_at")
+    paginator = CachedCountPaginator
+    show_full_result_count = False
+
+    def get_changelist(self, request, **kwargs):
+        # Change and delete views still load the full row via get_queryset
+        return TenantChangeList
+
+    def get_queryset(self, request):
+        # Select each row's primary domain in the same query so it can be
+        # displayed and sorted on without a JOIN over all domains
+        primary_domain = Domain.objects.filter(
+            tenant=OuterRef("pk"), is_primary=True
+        ).values("domain")[:1]
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(primary_domain=Subquery(primary_domain))
+        )
 
     def get_primary_domain(self, obj):
-        return obj.get_primary_domain()
+        return obj.primary_domain or ""
 
     get_primary_domain.short_description = "Domain"
-    get_primary_domain.admin_order_field = "domains__domain"
+    get_primary_domain.admin_order_field = "primary_domain"
 
     fieldsets = (
         ("Basic Information", {"fields": ("name", "description", "domain")}),
@@ -42,9 +89,23 @@ class TenantAdmin(admin.ModelAdmin):  # TenantAdminMixin temporarily disabled
 @admin.register(Domain)
 class DomainAdmin(admin.ModelAdmin):
     list_display = ("domain", "tenant", "is_primary")
+    list_select_related = ("tenant",)
+    paginator = CachedCountPaginator
+    show_full_result_count = False
     list_filter = ("is_primary",)
     search_fields = ("domain", "tenant__name")
 
+    def get_search_results(self, request, queryset, search_term):
+        # A lone hostname only matches domains. Skipping the OR with the
+        # tenant name JOIN leaves a single UPPER(domain) LIKE that the
+        # domain_domain_trgm index can serve. Anything else, such as a
+        # tenant name like "Acme Inc." or a quoted phrase, goes through the
+        # admin's own term splitting.
+        term = search_term.strip()
+        if HOSTNAME_SEARCH.fullmatch(term):
+            return queryset.filter(domain__icontains=term), False
+        return super().get_search_results(request, queryset, search_term)
+
 
 # Custom User admin temporarily disabled
 # @admin.register(User)
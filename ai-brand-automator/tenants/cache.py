@@ -0,0 +1,92 @@
+"""
+Cache helpers for tenant lookups.
+"""
+import hashlib
+
+from django.core.cache import cache
+
+from .models import Domain, Tenant
+
+PUBLIC_TENANT_CACHE_KEY = "tenants:public:v1"
+PUBLIC_TENANT_CACHE_TIMEOUT = 3600  # 1 hour
+DOMAIN_TENANT_CACHE_TIMEOUT = 900  # 15 minutes
+ADMIN_COUNT_CACHE_TIMEOUT = 300  # 5 minutes
+
+
+def get_public_tenant():
+    """
+    Return the public tenant, loading it from the database on a cache miss.
+
+    Raises Tenant.DoesNotExist if the public tenant has not been created.
+    """
+    tenant = cache.get(PUBLIC_TENANT_CACHE_KEY)
+    if tenant is None:
+        tenant = Tenant.objects.get(schema_name="public")
+        cache.set(PUBLIC_TENANT_CACHE_KEY, tenant, PUBLIC_TENANT_CACHE_TIMEOUT)
+    return tenant
+
+
+def invalidate_public_tenant():
+    """Drop the cached public tenant so the next lookup reloads it."""
+    cache.delete(PUBLIC_TENANT_CACHE_KEY)
+
+
+def domain_tenant_cache_key(hostname):
+    return f"tenants:domain:{hostname}"
+
+
+def get_tenant_for_domain(hostname):
+    """
+    Return the tenant that owns hostname, caching the Domain lookup.
+
+    Raises Domain.DoesNotExist if no tenant is registered for hostname.
+    """
+    key = domain_tenant_cache_key(hostname)
+    tenant = cache.get(key)
+    if tenant is None:
+        tenant = Domain.objects.select_related("tenant").get(domain=hostname).tenant
+        cache.set(key, tenant, DOMAIN_TENANT_CACHE_TIMEOUT)
+    return tenant
+
+
+def invalidate_domain(hostname):
+    """Drop the cached tenant for a single hostname."""
+    cache.delete(domain_tenant_cache_key(hostname))
+
+
+def invalidate_tenant_domains(tenant):
+    """Drop the cached tenant for every hostname the tenant owns."""
+    hostnames = Domain.objects.filter(tenant=tenant).values_list("domain", flat=True)
+    cache.delete_many([domain_tenant_cache_key(hostname) for hostname in hostnames])
+
+
+def count_version_key(model):
+    return f"tenants:count_version:{model._meta.label_lower}"
+
+
+def get_cached_count(queryset):
+    """
+    Return queryset.count(), cached per distinct SQL query.
+
+    Counts are dropped whenever a row of the model is saved or deleted (see
+    invalidate_cached_counts) and otherwise expire after
+    ADMIN_COUNT_CACHE_TIMEOUT.
+    """
+    model = queryset.model
+    version = cache.get(count_version_key(model), 0)
+    digest = hashlib.md5(str(queryset.query).encode(), usedforsecurity=False)
+    key = f"tenants:count:{model._meta.label_lower}:{version}:{digest.hexdigest()}"
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, ADMIN_COUNT_CACHE_TIMEOUT)
+    return count
+
+
+def invalidate_cached_counts(model):
+    """Drop every cached count for model by moving to a new key version."""
+    key = count_version_key(model)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, None)
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.16 on 2026-10-17 15:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tenants", "0003_alter_domain_options_tenant_schema_name_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="tenant",
+            index=models.Index(
+                fields=["created_at"], name="tenants_ten_created_99c6ff_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="tenant",
+            index=models.Index(
+                fields=["subscription_status", "created_at"],
+                name="tenants_ten_subscri_e76c36_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 4.2.16 on 2026-10-17 15:28
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+# The admin's icontains search compiles to UPPER("col"::text) LIKE UPPER(%s),
+# so the trigram indexes are built on UPPER(col) to match. Checked against
+# 20,000 tenants with EXPLAIN of Tenant.objects.filter(name__icontains="abc1"):
+#   Bitmap Heap Scan on tenants_tenant
+#     Recheck Cond: (upper((name)::text) ~~ '%ABC1%'::text)
+#     ->  Bitmap Index Scan on tenant_name_trgm
+# domain__icontains is served by domain_domain_trgm the same way. An index on
+# the raw column is never considered for either query.
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tenants", "0004_tenant_status_created_indexes"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="domain",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("domain"),
+                    name="gin_trgm_ops",
+                ),
+                name="domain_domain_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="tenant",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"),
+                    name="gin_trgm_ops",
+                ),
+                name="tenant_name_trgm",
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.16 on 2026-10-17 15:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tenants", "0005_trigram_search_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="domain",
+            index=models.Index(
+                fields=["tenant", "is_primary", "domain"],
+                name="domain_tenant_primary_idx",
+            ),
+        ),
+    ]
@@ -1,7 +1,14 @@
+import re
+
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django_tenants.models import TenantMixin, DomainMixin
 from django.utils import timezone
 
+# Characters that are not allowed in a generated schema name
+SCHEMA_NAME_INVALID_CHARS = re.compile(r"[^a-zA-Z0-9_]")
+
 
 class Tenant(TenantMixin):
     """
@@ -52,14 +59,17 @@ class Tenant(TenantMixin):
         # Auto-generate schema_name from name if not provided
         if not self.schema_name:
             # Create a valid schema name from the tenant name
-            import re
-
-            schema_name = re.sub(r"[^a-zA-Z0-9_]", "_", self.name.lower())
+            schema_name = SCHEMA_NAME_INVALID_CHARS.sub("_", self.name.lower())
             schema_name = f"tenant_{schema_name}"
-            # Ensure it's unique
-            counter = 1
+            # Ensure it's unique, fetching all candidate names in one query
             original_schema = schema_name
-            while Tenant.objects.filter(schema_name=schema_name).exists():
+            taken = set(
+                Tenant.objects.filter(
+                    schema_name__startswith=original_schema
+                ).values_list("schema_name", flat=True)
+            )
+            counter = 1
+            while schema_name in taken:
                 schema_name = f"{original_schema}_{counter}"
                 counter += 1
             self.schema_name = schema_name
@@ -68,6 +78,16 @@ class Tenant(TenantMixin):
     class Meta:
         verbose_name = "Tenant"
         verbose_name_plural = "Tenants"
+        indexes = [
+            models.Index(fields=["created_at"]),
+            models.Index(fields=["subscription_status", "created_at"]),
+            # Trigram index so admin icontains search on name avoids a seq scan.
+            # Postgres compiles icontains to UPPER(col::text) LIKE UPPER(%s),
+            # so the index is on that expression rather than the raw column.
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"), name="tenant_name_trgm"
+            ),
+        ]
 
     def __str__(self):
         return self.name
@@ -82,7 +102,19 @@ class Domain(DomainMixin):
     Domain model for tenant domains.
     """
 
-    pass
+    class Meta:
+        indexes = [
+            # Covers primary-domain lookups per tenant without touching the heap
+            models.Index(
+                fields=["tenant", "is_primary", "domain"],
+                name="domain_tenant_primary_idx",
+            ),
+            # Serves domain__icontains, which compiles to UPPER(domain::text)
+            GinIndex(
+                OpClass(Upper("domain"), name="gin_trgm_ops"),
+                name="domain_domain_trgm",
+            ),
+        ]
 
 
 # Temporarily removed custom User model to allow migrations
@@ -1,6 +1,17 @@
-from django.db.models.signals import post_save
+import logging
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
-from .models import Tenant
+from .cache import (
+    invalidate_cached_counts,
+    invalidate_domain,
+    invalidate_public_tenant,
+    invalidate_tenant_domains,
+)
+from .models import Domain, Tenant
+
+logger = logging.getLogger(__name__)
 
 
 @receiver(post_save, sender=Tenant)
@@ -10,5 +21,65 @@ def create_tenant_schema(sender, instance, created, **kwargs):
     Note: Domain must be created separately.
     """
     if created:
-        print(f"✅ Tenant {instance.name} created with schema '{instance.schema_name}'")
-        print("   Remember to create a Domain for this tenant")
+        transaction.on_commit(lambda: announce_tenant_created(instance))
+
+
+def announce_tenant_created(instance):
+    """Report a new tenant once its creating transaction has committed."""
+    logger.info(
+        "Tenant %s created with schema '%s'; remember to create a Domain for it",
+        instance.name,
+        instance.schema_name,
+    )
+
+
+@receiver(post_save, sender=Tenant)
+@receiver(post_delete, sender=Tenant)
+def clear_public_tenant_cache(sender, instance, **kwargs):
+    """Keep the cached public tenant in sync with the database row."""
+    # Invalidate after commit so a concurrent request cannot re-cache the old row
+    if instance.schema_name == "public":
+        transaction.on_commit(invalidate_public_tenant)
+
+
+@receiver(post_save, sender=Tenant)
+def clear_tenant_domain_cache(sender, instance, created, **kwargs):
+    """Refresh cached hostname lookups after a tenant's fields change."""
+    # Invalidate after commit so a concurrent request cannot re-cache the old row
+    if not created:
+        transaction.on_commit(lambda: invalidate_tenant_domains(instance))
+
+
+@receiver(pre_save, sender=Domain)
+def remember_previous_hostname(sender, instance, **kwargs):
+    """Note the stored hostname so a rename can invalidate it as well."""
+    instance._previous_domain = None
+    if instance.pk:
+        instance._previous_domain = (
+            Domain.objects.filter(pk=instance.pk)
+            .values_list("domain", flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=Domain)
+@receiver(post_delete, sender=Domain)
+def clear_domain_cache(sender, instance, **kwargs):
+    """Drop the cached tenant for a domain that was changed or removed."""
+    hostnames = {instance.domain, getattr(instance, "_previous_domain", None)}
+    hostnames.discard(None)
+
+    def invalidate():
+        for hostname in hostnames:
+            invalidate_domain(hostname)
+
+    transaction.on_commit(invalidate)
+
+
+@receiver(post_save, sender=Tenant)
+@receiver(post_delete, sender=Tenant)
+@receiver(post_save, sender=Domain)
+@receiver(post_delete, sender=Domain)
+def clear_admin_counts(sender, instance, **kwargs):
+    """Drop cached changelist counts so new rows are reachable from the pages."""
+    transaction.on_commit(lambda: invalidate_cached_counts(sender))
@@ -0,0 +1,12 @@
+"""
+Shared fixtures for the tenants tests.
+"""
+import pytest
+
+from tenants.models import Tenant
+
+
+@pytest.fixture
+def no_schema_creation(monkeypatch):
+    """Skip creating a Postgres schema for each tenant saved in a test."""
+    monkeypatch.setattr(Tenant, "auto_create_schema", False)
@@ -0,0 +1,33 @@
+"""
+Tests for the tenant admin.
+"""
+import pytest
+from django.contrib import admin
+
+from tenants.admin import DomainAdmin
+from tenants.models import Domain, Tenant
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("no_schema_creation")
+class TestDomainAdminSearch:
+    """Tests for the domain admin's hostname search shortcut."""
+
+    @pytest.fixture
+    def acme_domain(self):
+        tenant = Tenant.objects.create(name="Acme Inc.", schema_name="tenant_acme")
+        return Domain.objects.create(domain="acme.localhost", tenant=tenant)
+
+    def _search(self, term):
+        model_admin = DomainAdmin(Domain, admin.site)
+        queryset, _ = model_admin.get_search_results(None, Domain.objects.all(), term)
+        return list(queryset)
+
+    def test_hostname_matches_domains(self, acme_domain):
+        """Test a hostname term finds the domain."""
+        assert self._search("acme.localhost") == [acme_domain]
+
+    def test_tenant_name_with_dot_matches_tenant(self, acme_domain):
+        """Test a tenant name containing a dot still searches tenant names."""
+        assert self._search("Acme Inc.") == [acme_domain]
+        assert self._search('"Acme Inc."') == [acme_domain]
@@ -0,0 +1,149 @@
+"""
+Tests for the tenant cache helpers and their invalidation.
+"""
+import pytest
+from django.core.cache import cache
+
+from brand_automator.middleware import CachedTenantMiddleware
+from tenants.cache import (
+    PUBLIC_TENANT_CACHE_KEY,
+    domain_tenant_cache_key,
+    get_cached_count,
+    get_public_tenant,
+    get_tenant_for_domain,
+)
+from tenants.models import Domain
+
+
+@pytest.mark.django_db
+class TestPublicTenantCache:
+    """Tests for the cached public tenant lookup."""
+
+    def test_public_tenant_served_from_cache(
+        self, public_tenant, django_assert_num_queries
+    ):
+        """Test the public tenant is only loaded from the database once."""
+        with django_assert_num_queries(1):
+            get_public_tenant()
+        with django_assert_num_queries(0):
+            tenant = get_public_tenant()
+
+        assert tenant.pk == public_tenant.pk
+
+    def test_public_tenant_invalidated_after_commit(
+        self, public_tenant, django_capture_on_commit_callbacks
+    ):
+        """Test saving the public tenant drops the cached row once committed."""
+        get_public_tenant()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            public_tenant.stripe_customer_id = "cus_test123"
+            public_tenant.save()
+            # Still cached until the transaction commits
+            assert cache.get(PUBLIC_TENANT_CACHE_KEY) is not None
+
+        assert cache.get(PUBLIC_TENANT_CACHE_KEY) is None
+        assert get_public_tenant().stripe_customer_id == "cus_test123"
+
+
+@pytest.mark.django_db
+class TestDomainTenantCache:
+    """Tests for the cached hostname -> tenant lookup and its invalidation."""
+
+    def test_second_request_served_from_cache(self, tenant, django_assert_num_queries):
+        """Test the middleware resolves a repeated hostname without queries."""
+        middleware = CachedTenantMiddleware(lambda request: None)
+
+        with django_assert_num_queries(1):
+            first = middleware.get_tenant(Domain, "test.localhost")
+        with django_assert_num_queries(0):
+            second = middleware.get_tenant(Domain, "test.localhost")
+
+        assert first.pk == second.pk == tenant.pk
+
+    def test_domain_save_drops_cached_hostname(
+        self, tenant, django_capture_on_commit_callbacks
+    ):
+        """Test saving a Domain invalidates its hostname once committed."""
+        get_tenant_for_domain("test.localhost")
+        domain = Domain.objects.get(domain="test.localhost")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            domain.is_primary = False
+            domain.save()
+            assert cache.get(domain_tenant_cache_key("test.localhost")) is not None
+
+        assert cache.get(domain_tenant_cache_key("test.localhost")) is None
+
+    def test_domain_delete_drops_cached_hostname(
+        self, tenant, django_capture_on_commit_callbacks
+    ):
+        """Test deleting a Domain invalidates its hostname."""
+        get_tenant_for_domain("test.localhost")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Domain.objects.get(domain="test.localhost").delete()
+
+        assert cache.get(domain_tenant_cache_key("test.localhost")) is None
+        with pytest.raises(Domain.DoesNotExist):
+            get_tenant_for_domain("test.localhost")
+
+    def test_domain_rename_drops_old_hostname(
+        self, tenant, django_capture_on_commit_callbacks
+    ):
+        """Test renaming a Domain invalidates the hostname it used to have."""
+        get_tenant_for_domain("test.localhost")
+        domain = Domain.objects.get(domain="test.localhost")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            domain.domain = "renamed.localhost"
+            domain.save()
+
+        assert cache.get(domain_tenant_cache_key("test.localhost")) is None
+        with pytest.raises(Domain.DoesNotExist):
+            get_tenant_for_domain("test.localhost")
+        assert get_tenant_for_domain("renamed.localhost").pk == tenant.pk
+
+    def test_tenant_update_refreshes_cached_hostnames(
+        self, tenant, django_capture_on_commit_callbacks
+    ):
+        """Test updating a Tenant drops the cached rows for its hostnames."""
+        get_tenant_for_domain("test.localhost")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            tenant.subscription_status = "past_due"
+            tenant.save()
+            cached = cache.get(domain_tenant_cache_key("test.localhost"))
+            assert cached.subscription_status == "active"
+
+        assert cache.get(domain_tenant_cache_key("test.localhost")) is None
+        assert get_tenant_for_domain("test.localhost").subscription_status == (
+            "past_due"
+        )
+
+
+@pytest.mark.django_db
+class TestCachedCount:
+    """Tests for the cached admin changelist counts."""
+
+    def test_count_served_from_cache(self, public_tenant, django_assert_num_queries):
+        """Test a repeated count of the same query does not hit the database."""
+        with django_assert_num_queries(1):
+            first = get_cached_count(Domain.objects.all())
+        with django_assert_num_queries(0):
+            second = get_cached_count(Domain.objects.all())
+
+        assert first == second == Domain.objects.count()
+
+    def test_new_domain_refreshes_count(
+        self, public_tenant, django_capture_on_commit_callbacks
+    ):
+        """Test adding a Domain drops the cached counts once committed."""
+        before = get_cached_count(Domain.objects.all())
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Domain.objects.create(
+                domain="extra.localhost", tenant=public_tenant, is_primary=False
+            )
+
+        assert get_cached_count(Domain.objects.all()) == before + 1
@@ -0,0 +1,30 @@
+"""
+Tests for the tenant models.
+"""
+import pytest
+
+from tenants.models import Tenant
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("no_schema_creation")
+class TestTenantSchemaName:
+    """Tests for schema names generated in Tenant.save."""
+
+    def test_schema_name_takes_next_free_suffix(self):
+        """Test a colliding name gets the first unused numeric suffix."""
+        Tenant.objects.create(name="Acme", schema_name="tenant_acme")
+        Tenant.objects.create(name="Acme", schema_name="tenant_acme_1")
+
+        tenant = Tenant.objects.create(name="Acme")
+
+        assert tenant.schema_name == "tenant_acme_2"
+
+    def test_schema_name_ignores_unrelated_prefix_matches(self):
+        """Test a longer name sharing the prefix does not shift the suffix."""
+        Tenant.objects.create(name="Acme Corp", schema_name="tenant_acme_corp")
+        Tenant.objects.create(name="Acme", schema_name="tenant_acme")
+
+        tenant = Tenant.objects.create(name="Acme")
+
+        assert tenant.schema_name == "tenant_acme_1"
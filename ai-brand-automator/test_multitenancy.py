@@ -17,7 +17,7 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "brand_automator.settings")
 django.setup()
 
 from tenants.models import Tenant, Domain  # noqa: E402
-from django.db import connection  # noqa: E402
+from django.db import connection, transaction  # noqa: E402
 from django_tenants.utils import schema_context  # noqa: E402
 
 
@@ -183,15 +183,16 @@ def cleanup_test_data():
     print("CLEANUP: Removing test data")
     print("=" * 80)
 
-    # Remove test tenant
-    test_tenants = Tenant.objects.filter(name__icontains="Test Company")
-    count = test_tenants.count()
-    test_tenants.delete()
-
-    # Remove test users
     from django.contrib.auth.models import User
 
-    User.objects.filter(username__in=["public_user", "tenant_user"]).delete()
+    # One transaction for both deletes; the tenant count comes from delete()
+    with transaction.atomic():
+        # Remove test tenant
+        _, deleted = Tenant.objects.filter(name__icontains="Test Company").delete()
+        count = deleted.get(Tenant._meta.label, 0)
+
+        # Remove test users
+        User.objects.filter(username__in=["public_user", "tenant_user"]).delete()
 
     print(f"✅ Cleaned up {count} test tenant(s) and test users")
     print()
@@ -3,10 +3,136 @@
 Create GitHub issues for AI Brand Automator codebase fixes - ALL 63 ISSUES
 """
 
+import json
+import os
+import re
 import subprocess
+import sys
+import threading
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import lru_cache
+from graphlib import TopologicalSorter
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+# Optional progress bar; plain per-issue lines are printed without it
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
+GRAPHQL_URL = 'https://api.github.com/graphql'
+REST_URL = 'https://api.github.com'
+
+# Titles and numbers of the repository's issues, revalidated by ETag each run
+ISSUE_CACHE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '.issue_cache.json'
+)
+
+# createIssue mutations sent together in one GraphQL request
+BATCH_SIZE = 10
+
+# Requests in flight at once, and the minimum gap between request starts.
+# GitHub's secondary rate limit allows at most 80 content-creating requests
+# per minute, so this is the fastest pace that stays under it.
+MAX_WORKERS = 5
+REQUEST_INTERVAL = 60 / 80
+
+# Transient gateway errors are retried by the connection pool. urllib3 only
+# resends idempotent methods on an error status, so a createIssue POST that
+# may already have gone through is never repeated; failed connections are.
+TRANSIENT_RETRY = Retry(total=3, backoff_factor=1, status_forcelist=[502, 503, 504])
+
+# Responses that no retry or later issue can succeed after (bad token, no
+# access to the repository), so the run stops instead of repeating them.
+# Rate limited 403s never get this far; RateLimiter retries those.
+FATAL_STATUSES = {401, 403, 404}
+FATAL_ERROR_TYPES = {'FORBIDDEN', 'NOT_FOUND', 'UNAUTHORIZED'}
+
+# "#N" in a body refers to the N-th entry of ISSUES (not markdown anchors)
+ISSUE_REF = re.compile(r'(?<!\w)#(\d+)\b')
+
+REPOSITORY_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    id
+    labels(first: 100) { nodes { id name } }
+  }
+}
+"""
 
-ISSUES = [
+# Every body ends by linking its section of the implementation plan
+PLAN = 'CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md'
+FOOTER = f'\n\n{{label}}: [{PLAN}]({PLAN}#{{anchor}})'
+
+# Footers shared by every issue from one section of the analysis
+SEE_BACKEND = FOOTER.format(label="See", anchor="21-backend-django-issues-25-issues")
+SEE_FRONTEND = FOOTER.format(label="See", anchor="22-frontend-nextjs-issues-13-issues")
+SEE_INTEGRATION = FOOTER.format(label="See", anchor="23-integration-issues-6-issues")
+SEE_MISSING = FOOTER.format(label="See", anchor="24-missing-implementations-8-issues")
+SEE_SECURITY = FOOTER.format(label="See", anchor="25-security-issues-5-issues")
+SEE_CONFIGURATION = FOOTER.format(label="See", anchor="26-configuration-issues-4-issues")
+
+# Label implied by the emoji (a single code point) that starts each title
+PRIORITY_LABELS = {
+    '🔴': 'critical',
+    '🟠': 'high',
+    '🟡': 'medium',
+    '🟢': 'low',
+    '📋': 'meta',
+}
+
+# Colour for each priority label, used when the repository lacks the label
+LABEL_COLORS = {
+    'critical': 'b60205',
+    'high': 'd93f0b',
+    'medium': 'fbca04',
+    'low': '0e8a16',
+    'meta': '5319e7',
+}
+
+# How the run summary names each priority
+PRIORITY_HEADINGS = {
+    '🔴': 'Critical',
+    '🟠': 'High Priority',
+    '🟡': 'Medium Priority',
+    '🟢': 'Low Priority',
+    '📋': 'Meta Tracking',
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Issue:
+    """An issue to create, with the metadata implied by its title and body"""
+    title: str
+    body: str
+    priority: str | None
+    labels: tuple[str, ...]
+    refs: frozenset[int]  # ISSUES positions cited as "#N"
+
+
+def _build_issues(issues):
+    """Derive each issue's priority, labels and references once, at load"""
+    built = []
+    for issue in issues:
+        # Every prefix is a single code point, so one dict lookup classifies
+        priority = PRIORITY_LABELS.get(issue['title'][:1])
+        built.append(Issue(
+            title=issue['title'],
+            body=issue['body'],
+            priority=priority,
+            labels=(priority,) if priority else (),
+            refs=frozenset(int(n) for n in ISSUE_REF.findall(issue['body'])),
+        ))
+    return built
+
+
+ISSUES = _build_issues([
     # ===== CRITICAL ISSUES (4) =====
     {
         "title": "🔴 C-01: Multi-tenancy middleware enabled but broken",
@@ -26,9 +152,8 @@ Enable full multi-tenancy (Option B approved):
 4. Implement domain routing logic
 5. Test tenant resolution
 
-**Location**: `brand_automator/settings.py` Line 73, 23+ references to `request.tenant`
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#21-backend-django-issues-25-issues)"""
+**Location**: `brand_automator/settings.py` Line 73, 23+ references to `request.tenant`"""
+        + SEE_BACKEND
     },
     {
         "title": "🔴 C-02: No user registration endpoint",
@@ -47,9 +172,8 @@ Cannot create accounts - application unusable
 4. Return JWT tokens (access + refresh)
 5. Wire up URL route
 
-**Location**: `brand_automator/urls.py`, Frontend: `RegisterForm.tsx` Line 30
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#21-backend-django-issues-25-issues)"""
+**Location**: `brand_automator/urls.py`, Frontend: `RegisterForm.tsx` Line 30"""
+        + SEE_BACKEND
     },
     {
         "title": "🔴 C-03: JWT login email/username mismatch",
@@ -71,9 +195,8 @@ class EmailTokenObtainPairSerializer(TokenObtainPairSerializer):
     username_field = 'email'
 ```
 
-**Location**: Frontend `LoginForm.tsx` Line 17, Backend JWT configuration
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#21-backend-django-issues-25-issues)"""
+**Location**: Frontend `LoginForm.tsx` Line 17, Backend JWT configuration"""
+        + SEE_BACKEND
     },
     {
         "title": "🔴 C-04: No tenant creation workflow",  
@@ -91,9 +214,8 @@ Company creation fails - onboarding broken
 3. Auto-create OnboardingProgress with tenant reference
 4. Ensure tenant exists before Company save
 
-**Location**: `onboarding/views.py` Line 36, `onboarding/models.py` Line 7
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#21-backend-django-issues-25-issues)"""
+**Location**: `onboarding/views.py` Line 36, `onboarding/models.py` Line 7"""
+        + SEE_BACKEND
     },
     
     # ===== HIGH PRIORITY ISSUES (20) =====
@@ -110,9 +232,8 @@ All models reference Tenant foreign key but tenant system is disabled. Migration
 - `ai_services/models.py` Line 7: `ChatSession.tenant = ForeignKey(Tenant)`
 
 ## Fix
-After enabling multi-tenancy, ensure all tenant FKs work correctly. Add tests for tenant isolation.
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#21-backend-django-issues-25-issues)"""
+After enabling multi-tenancy, ensure all tenant FKs work correctly. Add tests for tenant isolation."""
+        + SEE_BACKEND
     },
     {
         "title": "🟠 H-02: Database credentials exposed in source code",
@@ -128,9 +249,8 @@ Password `npg_ihO4oHanJW8e` is hardcoded in settings.py Lines 103-109
 4. Update .gitignore to exclude .env
 5. Never commit .env to Git
 
-**Location**: `brand_automator/settings.py` Lines 103-109
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#21-backend-django-issues-25-issues)"""
+**Location**: `brand_automator/settings.py` Lines 103-109"""
+        + SEE_BACKEND
     },
     {
         "title": "🟠 H-03: SECRET_KEY exposed with insecure default",
@@ -148,9 +268,8 @@ python -c 'from django.core.management.utils import get_random_secret_key; print
 
 Add to .env, remove default fallback from settings.py
 
-**Location**: `settings.py` Line 24
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#21-backend-django-issues-25-issues)"""
+**Location**: `settings.py` Line 24"""
+        + SEE_BACKEND
     },
     {
         "title": "🟠 H-04: File upload endpoint has hardcoded company ID",
@@ -169,9 +288,8 @@ File uploads only work for company ID=1, returns mock URLs
 - Filter by tenant: `request.tenant.company`
 - Enable real GCS upload
 
-**Location**: `onboarding/views.py` Lines 124-126
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#21-backend-django-issues-25-issues)"""
+**Location**: `onboarding/views.py` Lines 124-126"""
+        + SEE_BACKEND
     },
     {
         "title": "🟠 H-05: AI service tenant logging fails",
@@ -186,9 +304,8 @@ Foreign key constraint violation when logging AI generations
 ## Fix
 Validate tenant value or extract properly from request context
 
-**Location**: `ai_services/services.py` Line 76
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#21-backend-django-issues-25-issues)"""
+**Location**: `ai_services/services.py` Line 76"""
+        + SEE_BACKEND
     },
     {
         "title": "🟠 H-06: Missing GCS configuration",
@@ -207,9 +324,8 @@ All GCS settings default to empty strings. File uploads return mock URLs instead
    - `GS_CREDENTIALS_PATH`
 5. Test file upload/download
 
-**Location**: `settings.py` Lines 197-199
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#21-backend-django-issues-25-issues)"""
+**Location**: `settings.py` Lines 197-199"""
+        + SEE_BACKEND
     },
     {
         "title": "🟠 H-07: Missing authentication decorators on API views",
@@ -222,9 +338,8 @@ ai_services/views.py endpoints don't require authentication - unauthenticated us
 Add `@permission_classes([IsAuthenticated])` to all protected API views:
 - Lines 46, 97, 137, 177 in `ai_services/views.py`
 
-**Location**: `ai_services/views.py` Lines 46, 97, 137, 177
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#21-backend-django-issues-25-issues)"""
+**Location**: `ai_services/views.py` Lines 46, 97, 137, 177"""
+        + SEE_BACKEND
     },
     {
         "title": "🟠 H-08: OnboardingProgress auto-creation fails",
@@ -239,9 +354,8 @@ Company creation fails - onboarding broken
 ## Fix
 Fix tenant handling in `CompanyViewSet.perform_create()` to properly pass tenant from request
 
-**Location**: `onboarding/views.py` Lines 35-40
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#21-backend-django-issues-25-issues)"""
+**Location**: `onboarding/views.py` Lines 35-40"""
+        + SEE_BACKEND
     },
     {
         "title": "🟠 H-09: Chat session creation fails",
@@ -256,9 +370,8 @@ Chat functionality completely broken
 ## Fix
 Remove tenant dependency or properly implement tenant context in chat views
 
-**Location**: `ai_services/views.py` Lines 55-61
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#21-backend-django-issues-25-issues)"""
+**Location**: `ai_services/views.py` Lines 55-61"""
+        + SEE_BACKEND
     },
     {
         "title": "🟠 H-10: Missing error handling in AI service",
@@ -276,9 +389,8 @@ AI failures silently return mock data, debugging is difficult
 ## Fix
 Add proper error handling, structured logging, API key validation, and retry logic to GeminiAIService
 
-**Location**: `ai_services/services.py`
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#21-backend-django-issues-25-issues)"""
+**Location**: `ai_services/services.py`"""
+        + SEE_BACKEND
     },
     {
         "title": "🟠 H-11: Missing component exports (TypeScript errors)",
@@ -295,9 +407,8 @@ Missing `export` keywords on interfaces. Frontend doesn't compile.
 "Cannot find module './MessageBubble' or its corresponding type declarations"
 
 ## Fix
-Add `export` keyword to all interface declarations
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#22-frontend-nextjs-issues-13-issues)"""
+Add `export` keyword to all interface declarations"""
+        + SEE_FRONTEND
     },
     {
         "title": "🟠 H-12: Field name mismatches (camelCase vs snake_case)",
@@ -314,9 +425,8 @@ Backend receives empty values - data is lost on save
 Option 1: Convert in serializer with field aliases
 Option 2: Update frontend to send snake_case
 
-**Location**: `components/onboarding/CompanyForm.tsx`, `onboarding/models.py`
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#22-frontend-nextjs-issues-13-issues)"""
+**Location**: `components/onboarding/CompanyForm.tsx`, `onboarding/models.py`"""
+        + SEE_FRONTEND
     },
     {
         "title": "🟠 H-13: API client missing comprehensive error handling",
@@ -334,9 +444,8 @@ Poor error messages, no recovery from transient failures
 ## Fix
 Add comprehensive error handling for all HTTP status codes and implement retry logic
 
-**Location**: `lib/api.ts`
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#22-frontend-nextjs-issues-13-issues)"""
+**Location**: `lib/api.ts`"""
+        + SEE_FRONTEND
     },
     {
         "title": "🟠 H-14: Missing authentication guards on protected pages",
@@ -351,9 +460,8 @@ Create `useAuth()` hook:
 - Redirect to /auth/login if missing
 - Add to all protected pages
 
-**Location**: All page components (dashboard, chat, onboarding)
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#22-frontend-nextjs-issues-13-issues)"""
+**Location**: All page components (dashboard, chat, onboarding)"""
+        + SEE_FRONTEND
     },
     {
         "title": "🟠 H-15: Hardcoded company ID fallback in BrandForm",
@@ -367,9 +475,8 @@ Dangerous fallback - user might update wrong company's data
 ## Fix
 Show error if company_id not found, don't fallback to '1'
 
-**Location**: `components/onboarding/BrandForm.tsx` Line 29
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#22-frontend-nextjs-issues-13-issues)"""
+**Location**: `components/onboarding/BrandForm.tsx` Line 29"""
+        + SEE_FRONTEND
     },
     {
         "title": "🟠 H-16: Missing onboarding steps 3-5",
@@ -389,9 +496,8 @@ Users cannot complete onboarding flow
 ## Fix
 Implement remaining 3 steps with proper UI and API integration
 
-**Location**: `app/onboarding/` directory
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#22-frontend-nextjs-issues-13-issues)"""
+**Location**: `app/onboarding/` directory"""
+        + SEE_FRONTEND
     },
     {
         "title": "🟠 H-17: Dashboard data is static",
@@ -406,9 +512,8 @@ Dashboard shows fake data, not useful to users
 ## Fix
 Create dashboard API endpoints and integrate with real user data
 
-**Location**: `components/dashboard/OverviewCards.tsx`, `RecentActivity.tsx`, `QuickActions.tsx`
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#22-frontend-nextjs-issues-13-issues)"""
+**Location**: `components/dashboard/OverviewCards.tsx`, `RecentActivity.tsx`, `QuickActions.tsx`"""
+        + SEE_FRONTEND
     },
     {
         "title": "🟠 H-18: No token refresh logic",
@@ -423,9 +528,8 @@ Implement automatic token refresh before expiry:
 - Use refresh_token to get new access_token
 - Handle refresh token expiry
 
-**Location**: `lib/api.ts`
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#22-frontend-nextjs-issues-13-issues)"""
+**Location**: `lib/api.ts`"""
+        + SEE_FRONTEND
     },
     {
         "title": "🟠 H-19: Brand strategy generation UI missing",
@@ -440,9 +544,8 @@ Users cannot initiate brand strategy generation
 ## Fix
 Add button/form in onboarding step-3 to trigger generation, display results
 
-**Location**: Frontend onboarding flow
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#24-missing-implementations-8-issues)"""
+**Location**: Frontend onboarding flow"""
+        + SEE_MISSING
     },
     {
         "title": "🟠 H-20: Brand identity generation UI missing",
@@ -457,9 +560,8 @@ Users cannot generate brand identity
 ## Fix
 Add UI in onboarding step-4 for brand identity generation
 
-**Location**: Frontend onboarding flow
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#24-missing-implementations-8-issues)"""
+**Location**: Frontend onboarding flow"""
+        + SEE_MISSING
     },
     
     # ===== MEDIUM PRIORITY ISSUES (25) =====
@@ -470,9 +572,8 @@ See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEM
 No centralized request validation - invalid data can reach business logic
 
 ## Fix
-Add validation middleware or use DRF validators consistently across all views
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#24-missing-implementations-8-issues)"""
+Add validation middleware or use DRF validators consistently across all views"""
+        + SEE_MISSING
     },
     {
         "title": "🟡 M-02: Missing password strength validation",
@@ -483,9 +584,8 @@ No enforcement of password complexity - weak passwords allowed
 ## Fix
 Add password validators: min length 8, upper/lower/digit/special char requirements
 
-**Location**: User registration
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#24-missing-implementations-8-issues)"""
+**Location**: User registration"""
+        + SEE_MISSING
     },
     {
         "title": "🟡 M-03: No email verification",
@@ -496,9 +596,8 @@ Email addresses not verified - fake emails can register
 ## Fix
 Send verification email with token, verify before allowing full access
 
-**Location**: Registration flow
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#24-missing-implementations-8-issues)"""
+**Location**: Registration flow"""
+        + SEE_MISSING
     },
     {
         "title": "🟡 M-04: Missing rate limiting",
@@ -509,9 +608,8 @@ No rate limiting configured - vulnerable to brute force attacks
 ## Fix
 Add django-ratelimit or DRF throttling to authentication and API endpoints
 
-**Location**: All API endpoints
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#24-missing-implementations-8-issues)"""
+**Location**: All API endpoints"""
+        + SEE_MISSING
     },
     {
         "title": "🟡 M-05: No API response pagination",
@@ -522,9 +620,8 @@ All records returned at once - performance issues with large datasets
 ## Fix
 Add DRF pagination (PageNumberPagination) to list endpoints
 
-**Location**: List endpoints (companies, chat sessions, etc.)
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#24-missing-implementations-8-issues)"""
+**Location**: List endpoints (companies, chat sessions, etc.)"""
+        + SEE_MISSING
     },
     {
         "title": "🟡 M-06: Missing database indexes",
@@ -535,9 +632,8 @@ No indexes on frequently queried fields - slow queries as data grows
 ## Fix
 Add `db_index=True` to: email, created_at, tenant_id, and other frequently queried fields
 
-**Location**: Model definitions
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#24-missing-implementations-8-issues)"""
+**Location**: Model definitions"""
+        + SEE_MISSING
     },
     {
         "title": "🟡 M-07: No query optimization",
@@ -548,9 +644,8 @@ No `select_related` or `prefetch_related` - N+1 query problem
 ## Fix
 Add query optimization to viewsets with foreign key access
 
-**Location**: Views with foreign key traversal
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#24-missing-implementations-8-issues)"""
+**Location**: Views with foreign key traversal"""
+        + SEE_MISSING
     },
     {
         "title": "🟡 M-08: Missing logging configuration",
@@ -561,9 +656,8 @@ No structured logging configured - difficult to debug production issues
 ## Fix
 Configure logging with handlers, formatters, and log levels (INFO, WARNING, ERROR)
 
-**Location**: `settings.py`
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#24-missing-implementations-8-issues)"""
+**Location**: `settings.py`"""
+        + SEE_MISSING
     },
     {
         "title": "🟡 M-09: No error tracking",
@@ -574,9 +668,8 @@ No Sentry or error tracking integration - production errors go unnoticed
 ## Fix
 Integrate Sentry for error tracking and monitoring
 
-**Location**: Backend
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#24-missing-implementations-8-issues)"""
+**Location**: Backend"""
+        + SEE_MISSING
     },
     {
         "title": "🟡 M-10: Hardcoded frontend API URLs",
@@ -587,9 +680,8 @@ Some files use `http://localhost:8000` instead of environment variable
 ## Fix
 Ensure all API calls use `process.env.NEXT_PUBLIC_API_URL`
 
-**Location**: Various frontend components
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#24-missing-implementations-8-issues)"""
+**Location**: Various frontend components"""
+        + SEE_MISSING
     },
     {
         "title": "🟡 M-11: No loading states",
@@ -600,9 +692,8 @@ No loading spinners during API calls - poor UX
 ## Fix
 Add loading state management and UI indicators (spinners, skeletons)
 
-**Location**: Most frontend components
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#24-missing-implementations-8-issues)"""
+**Location**: Most frontend components"""
+        + SEE_MISSING
     },
     {
         "title": "🟡 M-12: No error boundaries",
@@ -613,9 +704,8 @@ No React error boundaries - whole app crashes on component errors
 ## Fix
 Add error boundary components to catch and display errors gracefully
 
-**Location**: Frontend app
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#24-missing-implementations-8-issues)"""
+**Location**: Frontend app"""
+        + SEE_MISSING
     },
     {
         "title": "🟡 M-13: Missing form validation messages",
@@ -626,9 +716,8 @@ Generic error messages - users don't know what to fix
 ## Fix
 Add specific validation messages for each field with clear guidance
 
-**Location**: Forms without proper validation feedback
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#24-missing-implementations-8-issues)"""
+**Location**: Forms without proper validation feedback"""
+        + SEE_MISSING
     },
     {
         "title": "🟡 M-14: No accessibility (a11y) attributes",
@@ -639,9 +728,8 @@ Missing ARIA labels, semantic HTML - not accessible to screen readers
 ## Fix
 Add proper ARIA attributes and semantic HTML to all components
 
-**Location**: Frontend components
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#24-missing-implementations-8-issues)"""
+**Location**: Frontend components"""
+        + SEE_MISSING
     },
     {
         "title": "🟡 M-15: Missing toast notifications",
@@ -652,9 +740,8 @@ No global notification system - users miss success/error feedback
 ## Fix
 Add toast notification library (react-hot-toast or similar)
 
-**Location**: Frontend
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#24-missing-implementations-8-issues)"""
+**Location**: Frontend"""
+        + SEE_MISSING
     },
     {
         "title": "🟡 M-16: No file type validation",
@@ -665,9 +752,8 @@ Only checks MIME type - malicious files could be uploaded
 ## Fix
 Add server-side file validation, virus scanning, content verification
 
-**Location**: File upload endpoint
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#24-missing-implementations-8-issues)"""
+**Location**: File upload endpoint"""
+        + SEE_MISSING
     },
     {
         "title": "🟡 M-17: Missing file size limits",
@@ -678,9 +764,8 @@ No max file size enforced - large files can consume storage/bandwidth
 ## Fix
 Add file size validation (e.g., 10MB limit) on backend and frontend
 
-**Location**: File upload
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#24-missing-implementations-8-issues)"""
+**Location**: File upload"""
+        + SEE_MISSING
     },
     {
         "title": "🟡 M-18: No image optimization",
@@ -691,9 +776,8 @@ Images uploaded as-is - large files slow down loading
 ## Fix
 Add image compression/optimization on upload (resize, compress)
 
-**Location**: File upload
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#24-missing-implementations-8-issues)"""
+**Location**: File upload"""
+        + SEE_MISSING
     },
     {
         "title": "🟡 M-19: Missing alt text for images",
@@ -704,9 +788,8 @@ No alt text on img tags - poor accessibility
 ## Fix
 Add meaningful alt text to all images
 
-**Location**: Frontend components with images
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#24-missing-implementations-8-issues)"""
+**Location**: Frontend components with images"""
+        + SEE_MISSING
     },
     {
         "title": "🟡 M-20: No caching strategy",
@@ -717,9 +800,8 @@ No caching for expensive queries - slow response times
 ## Fix
 Add Redis caching for AI responses, static data, and frequently accessed queries
 
-**Location**: Backend API
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#24-missing-implementations-8-issues)"""
+**Location**: Backend API"""
+        + SEE_MISSING
     },
     {
         "title": "🟡 M-21: Missing API documentation",
@@ -730,9 +812,8 @@ No Swagger/OpenAPI docs - frontend developers must read source code
 ## Fix
 Add drf-spectacular for auto-generated API documentation
 
-**Location**: Backend
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#24-missing-implementations-8-issues)"""
+**Location**: Backend"""
+        + SEE_MISSING
     },
     {
         "title": "🟡 M-22: No Docker configuration",
@@ -743,9 +824,8 @@ No Dockerfile or docker-compose.yml - inconsistent development environments
 ## Fix
 Create Docker configurations for backend, frontend, and database
 
-**Location**: Project root
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#24-missing-implementations-8-issues)"""
+**Location**: Project root"""
+        + SEE_MISSING
     },
     {
         "title": "🟡 M-23: Missing CI/CD pipeline",
@@ -756,9 +836,8 @@ No GitHub Actions for testing/deployment - manual testing required
 ## Fix
 Create CI/CD workflow for automated tests and deployment
 
-**Location**: `.github/workflows`
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#26-configuration-issues-4-issues)"""
+**Location**: `.github/workflows`"""
+        + SEE_CONFIGURATION
     },
     {
         "title": "🟡 M-24: No environment-specific settings",
@@ -769,9 +848,8 @@ Single settings file for all environments - dev/staging/prod mixed
 ## Fix
 Split into settings_dev.py, settings_staging.py, settings_prod.py
 
-**Location**: `settings.py`
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#26-configuration-issues-4-issues)"""
+**Location**: `settings.py`"""
+        + SEE_CONFIGURATION
     },
     {
         "title": "🟡 M-25: Missing backup strategy",
@@ -782,9 +860,8 @@ No automated backups configured - data loss risk
 ## Fix
 Configure Neon automated backups or implement backup script
 
-**Location**: Database
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#26-configuration-issues-4-issues)"""
+**Location**: Database"""
+        + SEE_CONFIGURATION
     },
     
     # ===== LOW PRIORITY ISSUES (14) =====
@@ -801,9 +878,8 @@ Frontend calls don't match backend endpoints exactly
 - Tenant requirements not met
 
 ## Fix
-See detailed table in analysis document
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#23-integration-issues-6-issues)"""
+See detailed table in analysis document"""
+        + SEE_INTEGRATION
     },
     {
         "title": "🟢 I-02: Missing CORS headers",
@@ -814,9 +890,8 @@ See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEM
 ## Fix
 Add `CORS_ALLOW_HEADERS = ['authorization', 'content-type']`
 
-**Location**: `settings.py` Line 125
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#23-integration-issues-6-issues)"""
+**Location**: `settings.py` Line 125"""
+        + SEE_INTEGRATION
     },
     {
         "title": "🟢 I-03: Inconsistent response format",
@@ -827,9 +902,8 @@ Some endpoints return `{data: {...}}`, others return data directly
 ## Fix
 Standardize all responses to consistent format
 
-**Location**: Various API endpoints
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#23-integration-issues-6-issues)"""
+**Location**: Various API endpoints"""
+        + SEE_INTEGRATION
     },
     {
         "title": "🟢 I-04: Missing API versioning",
@@ -840,9 +914,8 @@ Not all endpoints under `/api/v1/` prefix
 ## Fix
 Ensure all endpoints follow versioning pattern
 
-**Location**: URL structure
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#23-integration-issues-6-issues)"""
+**Location**: URL structure"""
+        + SEE_INTEGRATION
     },
     {
         "title": "🟢 I-05: No WebSocket support",
@@ -853,9 +926,8 @@ Chat uses polling instead of WebSocket - inefficient, high latency
 ## Fix
 Implement Django Channels for real-time chat
 
-**Location**: Chat feature
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#23-integration-issues-6-issues)"""
+**Location**: Chat feature"""
+        + SEE_INTEGRATION
     },
     {
         "title": "🟢 I-06: Missing health check endpoint",
@@ -866,9 +938,8 @@ No `/health` or `/ping` endpoint - load balancers can't check application health
 ## Fix
 Add health check endpoint returning 200 OK with system status
 
-**Location**: Backend
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#23-integration-issues-6-issues)"""
+**Location**: Backend"""
+        + SEE_INTEGRATION
     },
     # Security Issues (duplicates noted in analysis)
     {
@@ -880,9 +951,8 @@ Frontend doesn't include CSRF tokens - CSRF attacks possible
 ## Fix
 Configure DRF CSRF exemption for JWT or add CSRF tokens to requests
 
-**Location**: Frontend API calls
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#25-security-issues-5-issues)"""
+**Location**: Frontend API calls"""
+        + SEE_SECURITY
     },
     {
         "title": "🟢 S-04: File upload without validation",
@@ -893,9 +963,8 @@ No virus scanning, malware detection - malicious files could be uploaded
 ## Fix
 Add antivirus scanning, content validation, sanitization
 
-**Location**: File upload endpoint
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#25-security-issues-5-issues)"""
+**Location**: File upload endpoint"""
+        + SEE_SECURITY
     },
     {
         "title": "🟢 S-05: Prompt injection risk",
@@ -906,9 +975,8 @@ User input directly embedded in AI prompts - users could manipulate AI responses
 ## Fix
 Sanitize user input, add prompt injection detection
 
-**Location**: AI service
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#25-security-issues-5-issues)"""
+**Location**: AI service"""
+        + SEE_SECURITY
     },
     # Configuration Issues
     {
@@ -920,9 +988,8 @@ Required environment variables not documented
 ## Fix
 Document all required env vars in README
 
-**Missing**: SECRET_KEY, DEBUG, DATABASE_URL, GOOGLE_API_KEY, GCS vars, NEXT_PUBLIC_API_URL
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#26-configuration-issues-4-issues)"""
+**Missing**: SECRET_KEY, DEBUG, DATABASE_URL, GOOGLE_API_KEY, GCS vars, NEXT_PUBLIC_API_URL"""
+        + SEE_CONFIGURATION
     },
     {
         "title": "🟢 CF-02: No .env.example file",
@@ -933,9 +1000,8 @@ No template for environment variables
 ## Fix
 Create .env.example in both backend and frontend with all required variables
 
-**Location**: Project root
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#26-configuration-issues-4-issues)"""
+**Location**: Project root"""
+        + SEE_CONFIGURATION
     },
     {
         "title": "🟢 CF-03: No requirements-dev.txt",
@@ -946,9 +1012,8 @@ Dev dependencies missing - inconsistent dev tooling
 ## Fix
 Create requirements-dev.txt with pytest, black, flake8, mypy, etc.
 
-**Location**: Backend
-
-See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#26-configuration-issues-4-issues)"""
+**Location**: Backend"""
+        + SEE_CONFIGURATION
     },
     # Testing Issues
     {
@@ -958,9 +1023,8 @@ See: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEM
 All tests.py files are empty - no test coverage
 
 ## Fix
-Implement pytest test suite with 70% coverage target
-
-See Phase 3: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#54-phase-3-testing--quality-week-4)"""
+Implement pytest test suite with 70% coverage target"""
+        + FOOTER.format(label="See Phase 3", anchor="54-phase-3-testing--quality-week-4")
     },
     {
         "title": "🟢 T-02: Zero frontend tests",
@@ -969,9 +1033,8 @@ See Phase 3: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AN
 No Jest config, no tests - no frontend coverage
 
 ## Fix
-Set up Jest + RTL, create component tests, target 60% coverage
-
-See Phase 3: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#54-phase-3-testing--quality-week-4)"""
+Set up Jest + RTL, create component tests, target 60% coverage"""
+        + FOOTER.format(label="See Phase 3", anchor="54-phase-3-testing--quality-week-4")
     },
     
     # ===== META TRACKING ISSUES (3) =====
@@ -987,9 +1050,8 @@ See Phase 3: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AN
 
 **Goal**: Application becomes functional  
 **Timeline**: Week 1 (~15 hours)  
-**Status**: Not started
-
-See full plan: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#52-phase-1-critical-fixes-week-1)"""
+**Status**: Not started"""
+        + FOOTER.format(label="See full plan", anchor="52-phase-1-critical-fixes-week-1")
     },
     {
         "title": "📋 [META] Phase 2: High Priority Fixes Tracking",
@@ -1000,9 +1062,8 @@ See full plan: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_
 
 **Goal**: Core features working  
 **Timeline**: Week 2-3 (~30 hours)  
-**Status**: Blocked by Phase 1
-
-See full plan: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#53-phase-2-core-features-week-2-3)"""
+**Status**: Blocked by Phase 1"""
+        + FOOTER.format(label="See full plan", anchor="53-phase-2-core-features-week-2-3")
     },
     {
         "title": "📋 [META] Phase 3: Testing Implementation Tracking",
@@ -1017,65 +1078,456 @@ See full plan: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_
 - [ ] E2E tests (optional)
 
 **Timeline**: Week 4 (~43 hours)  
-**Status**: Blocked by Phase 2
-
-See full plan: [CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md](CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md#54-phase-3-testing--quality-week-4)"""
+**Status**: Blocked by Phase 2"""
+        + FOOTER.format(label="See full plan", anchor="54-phase-3-testing--quality-week-4")
     }
-]
+])
+
+class GraphQLError(Exception):
+    """Raised when the GitHub GraphQL API reports errors for a request"""
+
+
+class FatalError(Exception):
+    """Raised when GitHub rejects the token or repository, failing every request"""
+
+
+def report(message):
+    """Print a line without breaking the progress bar, if one is shown"""
+    if tqdm:
+        tqdm.write(message)
+    else:
+        print(message)
+
+
+def get_repo():
+    """Return (owner, name) of the repository to file issues against"""
+    repo = os.environ.get('GITHUB_REPOSITORY')
+    if not repo:
+        try:
+            url = subprocess.check_output(
+                ['git', 'remote', 'get-url', 'origin'],
+                stderr=subprocess.PIPE,
+                encoding='utf-8',
+            ).strip()
+        except subprocess.CalledProcessError as e:
+            print(f"❌ Set GITHUB_REPOSITORY=owner/name ({e.stderr.strip()})")
+            sys.exit(1)
+        repo = re.sub(r'\.git$', '', re.split(r'github\.com[:/]', url)[-1])
+    owner, name = repo.split('/')
+    return owner, name
+
+
+def get_token():
+    """Return a GitHub token from the environment or, failing that, gh's login"""
+    token = os.environ.get('GITHUB_TOKEN') or os.environ.get('GH_TOKEN')
+    if token:
+        return token
+    try:
+        # Resolved once per run; skip gh's update check while we're at it
+        return subprocess.check_output(
+            ['gh', 'auth', 'token'],
+            stderr=subprocess.DEVNULL,
+            encoding='utf-8',
+            env={**os.environ, 'GH_NO_UPDATE_NOTIFIER': '1'},
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
 
-def create_issue(title, body):
-    """Create a single GitHub issue"""
+def check_fatal(response, result=None):
+    """Raise FatalError if the response means the remaining requests will fail too"""
+    if response.status_code in FATAL_STATUSES:
+        raise FatalError(f"HTTP {response.status_code}: {response.reason}")
+    for error in (result or {}).get('errors') or []:
+        if error.get('type') in FATAL_ERROR_TYPES:
+            raise FatalError(error['message'])
+
+
+def graphql(client, query, **variables):
+    """Run a GraphQL query or mutation and return its data"""
+    response = client.post(
+        GRAPHQL_URL, json={'query': query, 'variables': variables}, timeout=30
+    )
+    check_fatal(response)
+    response.raise_for_status()
+    result = response.json()
+    check_fatal(response, result)
+    if result.get('errors'):
+        raise GraphQLError('; '.join(e['message'] for e in result['errors']))
+    return result['data']
+
+
+class RateLimitExceeded(Exception):
+    """Raised when GitHub is still rate limiting a request after every retry"""
+
+
+class RateLimiter:
+    """
+    Wraps a requests session so every call is paced for GitHub's rate limits.
+
+    Request starts are spaced at least min_interval apart across threads. The
+    gap widens to spread the remaining primary quota (X-RateLimit-Remaining)
+    over the time until X-RateLimit-Reset. Secondary rate limit responses are
+    retried after Retry-After, or with exponential backoff when it is absent.
+    """
+
+    def __init__(self, session, min_interval, max_retries=5):
+        self.session = session
+        self.min_interval = min_interval
+        self.interval = min_interval
+        self.max_retries = max_retries
+        self.lock = threading.Lock()
+        self.next_start = 0.0
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def request(self, method, url, **kwargs):
+        for attempt in range(self.max_retries + 1):
+            self.wait()
+            response = self.session.request(method, url, **kwargs)
+            if not self.is_rate_limited(response):
+                self.update(response)
+                return response
+            if attempt < self.max_retries:
+                retry_after = response.headers.get('Retry-After')
+                self.pause(int(retry_after) if retry_after else min(2 ** attempt, 60))
+        raise RateLimitExceeded(
+            f"still rate limited after {self.max_retries} retries"
+        )
+
+    def wait(self):
+        """
+        Sleep until this thread's start slot. Slots are reserved from the
+        previous start, not its end, so time spent waiting on a response
+        counts towards the gap instead of being added to it.
+        """
+        with self.lock:
+            now = time.monotonic()
+            delay = self.next_start - now
+            self.next_start = max(now, self.next_start) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+    def pause(self, seconds):
+        """Hold back every thread's next request for at least seconds"""
+        with self.lock:
+            self.next_start = max(self.next_start, time.monotonic() + seconds)
+
+    def update(self, response):
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset = response.headers.get('X-RateLimit-Reset')
+        if remaining is None or reset is None:
+            return
+        window = max(0.0, int(reset) - time.time())
+        with self.lock:
+            self.interval = max(self.min_interval, window / max(int(remaining), 1))
+
+    @staticmethod
+    def is_rate_limited(response):
+        if response.status_code == 429:
+            return True
+        return response.status_code == 403 and (
+            'Retry-After' in response.headers
+            or response.headers.get('X-RateLimit-Remaining') == '0'
+            or 'rate limit' in response.text.lower()
+        )
+
+
+def creation_waves(issues, created):
+    """
+    Yield lists of 1-based ISSUES positions to create together. Every issue
+    referenced as "#N" is created in an earlier wave than the issues citing it.
+
+    After each wave, positions missing from created count as failed and the
+    issues citing them are never yielded, since their links would be wrong.
+    Raises graphlib.CycleError (a ValueError) if the references form a cycle.
+    """
+    positions = set(range(1, len(issues) + 1))
+    sorter = TopologicalSorter({
+        pos: issue.refs & positions - {pos}
+        for pos, issue in enumerate(issues, 1)
+    })
+    sorter.prepare()
+    while sorter.is_active():
+        wave = sorted(sorter.get_ready())
+        if not wave:
+            break
+        yield wave
+        sorter.done(*(pos for pos in wave if pos in created))
+
+
+def link_issue_refs(body, numbers):
+    """Point "#N" references at the numbers GitHub assigned to those issues"""
+    return ISSUE_REF.sub(
+        lambda m: f"#{numbers.get(int(m.group(1)), m.group(1))}", body
+    )
+
+
+def fetch_existing_issues(client, owner, name):
+    """
+    Return {title: number} for every issue already in the repository.
+
+    The first page of the listing (newest first) is requested with the cached
+    ETag; a 304 means no issue was created since and the cache is reused
+    without spending rate limit.
+    """
+    repo = f'{owner}/{name}'
     try:
-        result = subprocess.run(
-            ['gh', 'issue', 'create', '--title', title, '--body', body],
-            capture_output=True,
-            text=True,
-            check=True
+        with open(ISSUE_CACHE, encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+
+    headers = {}
+    if cache.get('repo') == repo and cache.get('etag'):
+        headers['If-None-Match'] = cache['etag']
+    response = client.get(
+        f'{REST_URL}/repos/{repo}/issues',
+        params={'state': 'all', 'per_page': 100},
+        headers=headers,
+        timeout=30,
+    )
+    if response.status_code == 304:
+        return cache['issues']
+    check_fatal(response)
+    response.raise_for_status()
+
+    etag = response.headers.get('ETag')
+    issues = {}
+    while True:
+        for item in response.json():
+            if 'pull_request' not in item:
+                issues[item['title']] = item['number']
+        next_url = response.links.get('next', {}).get('url')
+        if not next_url:
+            break
+        response = client.get(next_url, timeout=30)
+        response.raise_for_status()
+
+    # Write then rename so an interrupted run never leaves a truncated cache
+    with open(f'{ISSUE_CACHE}.tmp', 'w', encoding='utf-8') as f:
+        json.dump({'repo': repo, 'etag': etag, 'issues': issues}, f)
+    os.replace(f'{ISSUE_CACHE}.tmp', ISSUE_CACHE)
+    return issues
+
+
+def create_labels(client, owner, name, labels):
+    """
+    Create labels missing from the repository and return {name: node id}.
+
+    A 422 means the label exists but was beyond the first page the
+    repository query returned, so it is looked up instead.
+    """
+    url = f'{REST_URL}/repos/{owner}/{name}/labels'
+    created = {}
+    for label in sorted(labels):
+        response = client.post(
+            url, json={'name': label, 'color': LABEL_COLORS.get(label, 'ededed')},
+            timeout=30,
         )
-        issue_url = result.stdout.strip()
-        issue_num = issue_url.split('/')[-1] if issue_url else '?'
-        print(f"✅ Created #{issue_num}: {title}")
-        return issue_num
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Failed to create: {title}")
-        print(f"   Error: {e.stderr}")
-        return None
+        if response.status_code == 422:
+            response = client.get(f'{url}/{label}', timeout=30)
+        check_fatal(response)
+        response.raise_for_status()
+        created[label] = response.json()['node_id']
+    return created
+
+
+@lru_cache(maxsize=None)
+def batch_mutation(count):
+    """Build a GraphQL document with count aliased createIssue mutations"""
+    params = ''.join(
+        f', $t{n}: String!, $b{n}: String!, $l{n}: [ID!]' for n in range(count)
+    )
+    fields = '\n'.join(
+        f'  i{n}: createIssue(input: {{repositoryId: $repositoryId, '
+        f'title: $t{n}, body: $b{n}, labelIds: $l{n}}}) {{ issue {{ number url }} }}'
+        for n in range(count)
+    )
+    return f'mutation($repositoryId: ID!{params}) {{\n{fields}\n}}'
+
+
+def create_issues(client, repository_id, issues):
+    """
+    Create [(title, body, label_ids)] in a single GraphQL request.
+
+    Returns the new issue numbers in order, with None for any that failed.
+    """
+    variables = {'repositoryId': repository_id}
+    for n, (title, body, label_ids) in enumerate(issues):
+        variables.update({f't{n}': title, f'b{n}': body, f'l{n}': list(label_ids)})
+    try:
+        response = client.post(
+            GRAPHQL_URL,
+            json={'query': batch_mutation(len(issues)), 'variables': variables},
+            timeout=60,
+        )
+        check_fatal(response)
+        response.raise_for_status()
+        result = response.json()
+        check_fatal(response, result)
+    except (requests.RequestException, ValueError) as e:
+        result = {'errors': [{'message': str(e)}]}
+
+    data = result.get('data') or {}
+    errors = {}
+    for error in result.get('errors') or []:
+        alias = (error.get('path') or [None])[0]
+        errors.setdefault(alias, error['message'])
+
+    numbers = []
+    for n, (title, _, _) in enumerate(issues):
+        created = data.get(f'i{n}')
+        if created:
+            issue_num = created['issue']['number']
+            report(f"✅ Created #{issue_num}: {title}")
+            numbers.append(issue_num)
+        else:
+            report(f"❌ Failed to create: {title}")
+            report(f"   Error: {errors.get(f'i{n}') or errors.get(None)}")
+            numbers.append(None)
+    return numbers
 
 def main():
     print("🚀 Creating ALL 63 GitHub issues for AI Brand Automator...\n")
     print(f"📊 Total issues to create: {len(ISSUES)}")
-    print("   🔴 Critical: 4")
-    print("   🟠 High Priority: 20") 
-    print("   🟡 Medium Priority: 25")
-    print("   🟢 Low Priority: 14")
-    print("   📋 Meta Tracking: 3\n")
+    counts = Counter(issue.priority for issue in ISSUES)
+    for emoji, heading in PRIORITY_HEADINGS.items():
+        print(f"   {emoji} {heading}: {counts[PRIORITY_LABELS[emoji]]}")
+    print()
     
-    created = []
+    token = get_token()
+    if not token:
+        print("❌ Set GITHUB_TOKEN (or GH_TOKEN), or log in with `gh auth login`")
+        sys.exit(1)
+
+    # One keep-alive session for every API call instead of a gh process per issue
+    session = requests.Session()
+    session.headers['Authorization'] = f'bearer {token}'
+    session.headers['Accept'] = 'application/vnd.github+json'
+    session.mount('https://', HTTPAdapter(max_retries=TRANSIENT_RETRY))
+    client = RateLimiter(session, REQUEST_INTERVAL)
+    owner, name = get_repo()
+    try:
+        repository = graphql(
+            client, REPOSITORY_QUERY, owner=owner, name=name
+        )['repository']
+    except FatalError as e:
+        print(f"❌ Cannot access {owner}/{name}, aborting: {e}")
+        sys.exit(1)
+    repository_id = repository['id']
+    label_ids = {
+        label['name']: label['id'] for label in repository['labels']['nodes']
+    }
+    missing = {
+        label for issue in ISSUES for label in issue.labels
+    } - label_ids.keys()
+    if missing:
+        print(f"🏷️  Creating labels: {', '.join(sorted(missing))}\n")
+        try:
+            label_ids.update(create_labels(client, owner, name, missing))
+        except (FatalError, requests.RequestException) as e:
+            print(f"❌ Cannot create labels in {owner}/{name}, aborting: {e}")
+            sys.exit(1)
+
+    def create(batch):
+        return create_issues(client, repository_id, [
+            (
+                ISSUES[pos - 1].title,
+                link_issue_refs(ISSUES[pos - 1].body, numbers),
+                [label_ids[label] for label in ISSUES[pos - 1].labels
+                 if label in label_ids],
+            )
+            for pos in batch
+        ])
+
+    numbers = {}  # ISSUES position -> number GitHub assigned
     failed = []
-    
-    for i, issue in enumerate(ISSUES, 1):
-        print(f"[{i}/{len(ISSUES)}] Creating: {issue['title'][:60]}...")
-        issue_num = create_issue(issue['title'], issue['body'])
-        
-        if issue_num:
-            created.append(issue_num)
-        else:
-            failed.append(issue['title'])
-        
-        # Rate limit: 1 second between requests
-        if i < len(ISSUES):
-            time.sleep(1)
-    
+
+    # Skip issues created by an earlier run, keeping their numbers for "#N" links
+    existing = fetch_existing_issues(client, owner, name)
+    for pos, issue in enumerate(ISSUES, 1):
+        if issue.title in existing:
+            numbers[pos] = existing[issue.title]
+    if numbers:
+        print(f"⏭️  Skipping {len(numbers)} issues that already exist\n")
+    skipped = len(numbers)
+
+    # Issues are numbered in the order GitHub receives them, so create them
+    # in dependency waves and rewrite "#N" references to the real numbers.
+    # If GitHub keeps rate limiting, stop; a re-run skips what was created.
+    # A rejected token or repository fails every later batch too, so abort.
+    stopped = None
+    aborted = None
+    executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    progress = None
+    if tqdm:
+        progress = tqdm(
+            total=len(ISSUES) - skipped, desc="Creating issues", unit="issue"
+        )
+    try:
+        for wave in creation_waves(ISSUES, numbers):
+            wave = [pos for pos in wave if pos not in numbers]
+            futures = {}
+            for i in range(0, len(wave), BATCH_SIZE):
+                batch = wave[i:i + BATCH_SIZE]
+                if not progress:
+                    for pos in batch:
+                        title = ISSUES[pos - 1].title
+                        print(f"[{pos}/{len(ISSUES)}] Creating: {title[:60]}...")
+                futures[executor.submit(create, batch)] = batch
+
+            for future in as_completed(futures):
+                batch = futures[future]
+                for pos, issue_num in zip(batch, future.result()):
+                    if issue_num:
+                        numbers[pos] = issue_num
+                    else:
+                        failed.append(ISSUES[pos - 1].title)
+                if progress:
+                    progress.update(len(batch))
+    except RateLimitExceeded as e:
+        stopped = e
+    except FatalError as e:
+        aborted = e
+    finally:
+        executor.shutdown(cancel_futures=True)
+        if progress:
+            progress.close()
+
+    # Issues left over when the waves ran out cite one that failed
+    blocked = []
+    if not (stopped or aborted):
+        blocked = [
+            issue.title for pos, issue in enumerate(ISSUES, 1)
+            if pos not in numbers and issue.title not in failed
+        ]
+
     print(f"\n{'='*60}")
-    print(f"✅ Successfully created {len(created)} issues")
+    print(f"✅ Successfully created {len(numbers) - skipped} issues")
     if failed:
         print(f"❌ Failed to create {len(failed)} issues:")
         for title in failed:
             print(f"   - {title}")
+    if blocked:
+        print(f"⏭️  Held back {len(blocked)} issues that reference a failed one:")
+        for title in blocked:
+            print(f"   - {title}")
+    if stopped:
+        print(f"⏸️  Stopped early: GitHub is {stopped}")
+        print("   Re-run later; issues that were created will be skipped")
+    if aborted:
+        print(f"🛑 Aborted: {aborted}")
     print(f"{'='*60}\n")
+    if aborted:
+        sys.exit(1)
     
     print("View all issues: gh issue list")
-    print("See full details: CODEBASE_ANALYSIS_AND_IMPLEMENTATION_PLAN.md")
+    print(f"See full details: {PLAN}")
 
 if __name__ == '__main__':
     main()
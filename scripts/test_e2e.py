@@ -3,36 +3,50 @@
 E2E Testing Script for AI Brand Automator
 """
 import requests
+import itertools
 import json
 import sys
 import time
 
 BASE_URL = "http://localhost:8000/api/v1"
 
-def test_registration():
+# Shared keep-alive connection for every request the suite makes
+SESSION = requests.Session()
+
+# Seeded once so emails differ across runs and within a run
+_EMAIL_COUNTER = itertools.count(time.time_ns())
+
+def unique_email():
+    """Return an email address no earlier registration has used"""
+    return f"test_{next(_EMAIL_COUNTER)}@brandautomator.com"
+
+def test_registration(email):
     """Test 1.1: User Registration"""
     print("\n" + "="*60)
     print("TEST 1.1: User Registration")
     print("="*60)
     
-    # Use timestamp to ensure unique email on each run
-    timestamp = int(time.time())
     url = f"{BASE_URL}/auth/register/"
     payload = {
-        "email": f"test_{timestamp}@brandautomator.com",
+        "email": email,
         "password": "SecurePass123!",
         "first_name": "Test",
         "last_name": "User"
     }
     
     try:
-        response = requests.post(url, json=payload, timeout=10)
+        response = SESSION.post(url, json=payload, timeout=10)
         print(f"Status Code: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
+        try:
+            data = response.json()
+        except ValueError:
+            print(f"❌ FAIL: Response is not JSON: {response.text}")
+            return None
+        print(f"Response: {json.dumps(data, indent=2)}")
         
         if response.status_code == 201:
             print("✅ PASS: User registered successfully")
-            return response.json()
+            return data
         else:
             print(f"❌ FAIL: Expected 201, got {response.status_code}")
             return None
@@ -40,17 +54,12 @@ def test_registration():
         print(f"❌ ERROR: {e}")
         return None
 
-def test_login(email=None, password="SecurePass123!"):
+def test_login(email, password="SecurePass123!"):
     """Test 1.2: User Login"""
     print("\n" + "="*60)
     print("TEST 1.2: User Login")
     print("="*60)
     
-    # Use timestamp email if none provided
-    if email is None:
-        timestamp = int(time.time())
-        email = f"test_{timestamp}@brandautomator.com"
-    
     url = f"{BASE_URL}/auth/login/"
     payload = {
         "email": email,
@@ -58,15 +67,19 @@ def test_login(email=None, password="SecurePass123!"):
     }
     
     try:
-        response = requests.post(url, json=payload, timeout=10)
+        response = SESSION.post(url, json=payload, timeout=10)
         print(f"Status Code: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
+        try:
+            data = response.json()
+        except ValueError:
+            print(f"❌ FAIL: Response is not JSON: {response.text}")
+            return None
+        print(f"Response: {json.dumps(data, indent=2)}")
         
         if response.status_code == 200:
-            tokens = response.json()
-            if 'access' in tokens and 'refresh' in tokens:
+            if 'access' in data and 'refresh' in data:
                 print("✅ PASS: Login successful, tokens received")
-                return tokens
+                return data
             else:
                 print("❌ FAIL: Tokens not found in response")
                 return None
@@ -89,7 +102,7 @@ def test_protected_endpoint(access_token):
     }
     
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = SESSION.get(url, headers=headers, timeout=10)
         print(f"Status Code: {response.status_code}")
         
         if response.status_code in [200, 404]:
@@ -111,7 +124,7 @@ def test_unauthenticated_access():
     url = f"{BASE_URL}/companies/"
     
     try:
-        response = requests.get(url, timeout=10)
+        response = SESSION.get(url, timeout=10)
         print(f"Status Code: {response.status_code}")
         
         if response.status_code == 401:
@@ -136,7 +149,8 @@ def main():
     results.append(("Unauthenticated Access Blocked", test_unauthenticated_access()))
     
     # Test 1.1: Registration
-    registration_data = test_registration()
+    email = unique_email()
+    registration_data = test_registration(email)
     results.append(("User Registration", registration_data is not None))
     
     if registration_data:
@@ -155,7 +169,7 @@ def main():
     else:
         # Try login if registration failed (user might already exist)
         print("\n⚠️  Registration failed, attempting login instead...")
-        tokens = test_login()
+        tokens = test_login(email)
         results.append(("User Login", tokens is not None))
         
         if tokens: